@@ -70,32 +70,7 @@ class DataLoader:
         """Export raw data summary for reference"""
         try:
             export_dir = Path("AutoAnalytiX__Reports") / "Data_Exports"
-            
-            summary = {
-                'telemetry_1': {
-                    'records': len(datasets['telemetry_1']),
-                    'columns': datasets['telemetry_1'].columns.tolist(),
-                    'date_range': {
-                        'start': str(datasets['telemetry_1']['timestamp'].min()) if 'timestamp' in datasets['telemetry_1'].columns else 'N/A',
-                        'end': str(datasets['telemetry_1']['timestamp'].max()) if 'timestamp' in datasets['telemetry_1'].columns else 'N/A'
-                    }
-                },
-                'telemetry_2': {
-                    'records': len(datasets['telemetry_2']),
-                    'columns': datasets['telemetry_2'].columns.tolist(),
-                    'date_range': {
-                        'start': str(datasets['telemetry_2']['timestamp'].min()) if 'timestamp' in datasets['telemetry_2'].columns else 'N/A',
-                        'end': str(datasets['telemetry_2']['timestamp'].max()) if 'timestamp' in datasets['telemetry_2'].columns else 'N/A'
-                    }
-                },
-                'vehicle_data': {
-                    'records': len(datasets['vehicle_data']),
-                    'columns': datasets['vehicle_data'].columns.tolist()
-                }
-            }
-
-            summary_path = export_dir / "raw_data_summary.json"
-            self.data_exporter.export_to_json(summary, summary_path, "Raw Data Summary")
+            self.data_exporter.export_raw_data_summary(datasets, export_dir)
 
         except Exception as e:
             self.logger.error(f"Failed to export raw data summary: {e}")
\ No newline at end of file
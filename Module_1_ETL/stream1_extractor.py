@@ -27,24 +27,26 @@ class Stream1Extractor:
 
         # Process each vehicle individually to preserve sensor characteristics
         for vehicle_id in tqdm(unique_vehicles, desc="Processing vehicles (Stream 1)"):
-            vehicle_data = telemetry_1[telemetry_1['vehicle_id'] == vehicle_id].copy()
-            vehicle_data = vehicle_data.sort_values('TIMESTAMP')
+            vehicle_data = telemetry_1[telemetry_1['vehicle_id'] == vehicle_id].sort_values('TIMESTAMP')
+
+            # Count non-null readings of every meter in one pass; absent meters are skipped
+            meter_counts = vehicle_data[['speed', 'odometer', 'fuel_level']].count()
 
             # Extract Speed Data - preserve all speed readings with timestamps
-            speed_mask = vehicle_data['speed'].notna()
-            if speed_mask.any():
+            if meter_counts['speed'] > 0:
+                speed_mask = vehicle_data['speed'].notna()
                 speed_data = vehicle_data.loc[speed_mask, ['TIMESTAMP', 'speed']].reset_index(drop=True)
                 vehicle_meter_data[vehicle_id]['speed'] = speed_data
 
             # Extract Odometer Data - critical for distance calculations
-            odometer_mask = vehicle_data['odometer'].notna()
-            if odometer_mask.any():
+            if meter_counts['odometer'] > 0:
+                odometer_mask = vehicle_data['odometer'].notna()
                 odometer_data = vehicle_data.loc[odometer_mask, ['TIMESTAMP', 'odometer']].reset_index(drop=True)
                 vehicle_meter_data[vehicle_id]['odometer'] = odometer_data
 
             # Extract Fuel Level Data - essential for theft detection
-            fuel_mask = vehicle_data['fuel_level'].notna()
-            if fuel_mask.any():
+            if meter_counts['fuel_level'] > 0:
+                fuel_mask = vehicle_data['fuel_level'].notna()
                 fuel_data = vehicle_data.loc[fuel_mask, ['TIMESTAMP', 'fuel_level']].reset_index(drop=True)
                 vehicle_meter_data[vehicle_id]['fuel'] = fuel_data
 
@@ -25,6 +25,17 @@ class Stream2Extractor:
         vehicle_meter_data = defaultdict(lambda: defaultdict(pd.DataFrame))
         unique_vehicles = telemetry_2['vehicle_id'].unique()
 
+        # Apply robust numeric conversion once for the whole stream
+        numeric_values = pd.to_numeric(telemetry_2['val'], errors='coerce')
+        missing_values = telemetry_2['val'].isna()
+        invalid_values = numeric_values.isna() & ~missing_values
+
+        invalid_count = invalid_values.sum()
+        if invalid_count > 0:
+            self.logger.warning(f"⚠️  Removed {invalid_count:,} non-numeric parameter values")
+
+        telemetry_2 = telemetry_2.assign(val=numeric_values)[numeric_values.notna()]
+
         # Define parameter mapping for robust extraction
         parameter_mapping = {
             'speed': 'speed',
@@ -33,24 +44,18 @@ class Stream2Extractor:
         }
 
         for vehicle_id in tqdm(unique_vehicles, desc="Processing vehicles (Stream 2)"):
-            vehicle_data = telemetry_2[telemetry_2['vehicle_id'] == vehicle_id].copy()
+            vehicle_data = telemetry_2[telemetry_2['vehicle_id'] == vehicle_id]
 
             # Process each meter type separately to maintain data integrity
             for param_name, meter_type in parameter_mapping.items():
-                param_data = vehicle_data[vehicle_data['name'] == param_name].copy()
+                param_data = vehicle_data[vehicle_data['name'] == param_name]
 
                 if len(param_data) > 0:
                     # Convert parameter-value format to structured format
-                    meter_df = param_data[['TIMESTAMP', 'val']].copy()
-                    meter_df.rename(columns={'val': param_name}, inplace=True)
-
-                    # Apply robust numeric conversion with error handling
-                    meter_df[param_name] = pd.to_numeric(meter_df[param_name], errors='coerce')
-                    meter_df = meter_df.dropna(subset=[param_name])
+                    meter_df = param_data[['TIMESTAMP', 'val']].rename(columns={'val': param_name})
 
-                    if len(meter_df) > 0:
-                        meter_df = meter_df.sort_values('TIMESTAMP').reset_index(drop=True)
-                        vehicle_meter_data[vehicle_id][meter_type] = meter_df
+                    meter_df = meter_df.sort_values('TIMESTAMP').reset_index(drop=True)
+                    vehicle_meter_data[vehicle_id][meter_type] = meter_df
 
         self.logger.info(f"✅ Stream 2 processed: {len(unique_vehicles)} vehicles")
         return dict(vehicle_meter_data)
\ No newline at end of file
@@ -6,8 +6,6 @@ Handles robust timestamp parsing and standardization across datasets.
 """
 
 import pandas as pd
-from dateutil import parser
-from tqdm import tqdm
 
 
 class TimestampProcessor:
@@ -20,22 +18,25 @@ class TimestampProcessor:
 
     def standardize_timestamps(self, df, timestamp_col='timestamp'):
         """Advanced timestamp standardization with robust parsing"""
-        df_clean = df.copy()
-
-        def safe_parse_timestamp(ts):
-            """Safely parse various timestamp formats"""
-            try:
-                return parser.parse(str(ts))
-            except (ValueError, TypeError):
-                return pd.NaT
-
-        # Apply timestamp parsing with progress tracking
-        tqdm.pandas(desc=f"Parsing {timestamp_col}")
-        df_clean['TIMESTAMP'] = df_clean[timestamp_col].progress_apply(safe_parse_timestamp)
-
-        # Remove invalid timestamps
-        initial_count = len(df_clean)
-        df_clean = df_clean.dropna(subset=['TIMESTAMP'])
+        # Parse the whole column in one vectorized pass; unparseable values become NaT.
+        # Readings carry mixed UTC offsets (e.g. -07:00/-08:00 across DST), so they are
+        # normalized to UTC to share a single datetime dtype.
+        raw_timestamps = df[timestamp_col]
+        parsed_timestamps = pd.to_datetime(raw_timestamps, errors='coerce', utc=True, format='ISO8601')
+
+        # Telemetry timestamps are ISO 8601; only values the fast ISO parser rejects
+        # go through the slower per-value format inference
+        unparsed = parsed_timestamps.isna() & raw_timestamps.notna()
+        if unparsed.any():
+            parsed_timestamps[unparsed] = pd.to_datetime(raw_timestamps[unparsed], errors='coerce',
+                                                         utc=True, format='mixed')
+
+        # Replace the original timestamp column and remove invalid timestamps
+        # without deep-copying the untouched columns first
+        initial_count = len(df)
+        df_clean = (df.drop(columns=[timestamp_col])
+                      .assign(TIMESTAMP=parsed_timestamps)
+                      .dropna(subset=['TIMESTAMP']))
         final_count = len(df_clean)
 
         # Log timestamp processing statistics
@@ -43,8 +44,4 @@ class TimestampProcessor:
         if invalid_timestamps > 0:
             self.logger.warning(f"⚠️  Removed {invalid_timestamps:,} invalid timestamps ({invalid_timestamps/initial_count*100:.1f}%)")
 
-        # Remove original timestamp column to avoid confusion
-        if timestamp_col in df_clean.columns:
-            df_clean.drop(columns=[timestamp_col], inplace=True)
-
         return df_clean
\ No newline at end of file
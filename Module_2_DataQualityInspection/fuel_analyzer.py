@@ -7,6 +7,7 @@ Advanced fuel pattern analysis with range violation detection.
 
 import pandas as pd
 import numpy as np
+from shared.math_utils import calculate_basic_stats, calculate_moving_averages
 
 
 class FuelAnalyzer:
@@ -19,17 +20,8 @@ class FuelAnalyzer:
 
     def calculate_moving_averages(self, data_series, windows=[5, 10]):
         """Calculate multiple moving averages for fuel trend analysis"""
-        moving_averages = {}
-
-        for window in windows:
-            if len(data_series) >= window:
-                ma = data_series.rolling(window=window, center=True).mean()
-                moving_averages[f'MA_{window}'] = ma
-            else:
-                # If insufficient data, create MA with available data
-                moving_averages[f'MA_{window}'] = data_series.rolling(window=len(data_series), center=True).mean()
-
-        return moving_averages
+        # Windows longer than the series use the available data
+        return calculate_moving_averages(data_series, windows)
 
     def analyze_fuel_patterns(self, vehicle_id, fuel_data):
         """Advanced fuel pattern analysis with range violation detection"""
@@ -46,7 +38,11 @@ class FuelAnalyzer:
         moving_averages = self.calculate_moving_averages(fuel_levels, windows=[5, 10])
 
         # Identify range violations (physically impossible readings)
-        range_violations = (fuel_levels < 0) | (fuel_levels > 100)
+        fuel_array = fuel_levels.to_numpy(dtype=np.float64)
+        negative_readings = fuel_array < 0
+        over_100_readings = fuel_array > 100
+        range_violations = negative_readings | over_100_readings
+        range_violation_count = int(range_violations.sum())
         range_violation_data = fuel_sorted[range_violations].copy()
 
         # Identify large fuel drops for further investigation
@@ -55,21 +51,22 @@ class FuelAnalyzer:
         large_drop_data = fuel_sorted[large_drops].copy()
 
         # Calculate comprehensive fuel statistics
+        basic_stats = calculate_basic_stats(fuel_array)
         fuel_stats = {
             'total_readings': len(fuel_data),
-            'min_fuel': fuel_levels.min(),
-            'max_fuel': fuel_levels.max(),
-            'mean_fuel': fuel_levels.mean(),
-            'std_fuel': fuel_levels.std(),
-            'range_violations': range_violations.sum(),
+            'min_fuel': basic_stats['min'],
+            'max_fuel': basic_stats['max'],
+            'mean_fuel': basic_stats['mean'],
+            'std_fuel': basic_stats['std'],
+            'range_violations': range_violation_count,
             'large_drops': large_drops.sum(),
-            'negative_readings': (fuel_levels < 0).sum(),
-            'over_100_readings': (fuel_levels > 100).sum(),
+            'negative_readings': int(negative_readings.sum()),
+            'over_100_readings': int(over_100_readings.sum()),
             'time_span_days': (timestamps.max() - timestamps.min()).days
         }
 
         # Data quality assessment based on range violations
-        violation_rate = range_violations.sum() / len(fuel_levels) * 100
+        violation_rate = range_violation_count / len(fuel_array) * 100
         data_quality_score = max(0, 100 - violation_rate * 10)
 
         # Log critical fuel anomalies
@@ -5,9 +5,9 @@ Extracted from original AutoAnalytiX DATAQUALITYINSPECTION_MODULE.plot_fuel_anal
 Creates professional fuel analysis plots.
 """
 
-import matplotlib.pyplot as plt
-import traceback
+from functools import partial
 from pathlib import Path
+from shared.plot_utils import close_plot, create_figure, save_plot
 
 
 class FuelPlotter:
@@ -24,11 +24,12 @@ class FuelPlotter:
         if fuel_analysis is None:
             return
 
+        fig = None
         try:
             fuel_data = fuel_analysis['raw_data']
             moving_averages = fuel_analysis['moving_averages']
 
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(16, 12))
+            fig, (ax1, ax2) = create_figure(2, 1, figsize=(16, 12))
 
             # Plot 1: Fuel Time Series with Moving Averages
             ax1.plot(fuel_data['TIMESTAMP'], fuel_data['fuel_level'],
@@ -37,7 +38,7 @@ class FuelPlotter:
             # Plot moving averages
             colors = ['red', 'green']
             for i, (ma_name, ma_data) in enumerate(moving_averages.items()):
-                if len(ma_data.dropna()) > 0:
+                if ma_data.notna().any():
                     ax1.plot(fuel_data['TIMESTAMP'], ma_data,
                             color=colors[i % len(colors)], linewidth=2, label=ma_name)
 
@@ -82,17 +83,16 @@ class FuelPlotter:
             ax2.legend()
             ax2.grid(True, alpha=0.3)
 
-            plt.tight_layout()
+            fig.tight_layout()
 
             # Save plot with error handling
             plot_path = self.reports_dir / "Plots" / "Fuel_Quality" / f"{vehicle_id}_fuel_analysis.pdf"
-            plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-            plt.close()
-
-            # Verify plot creation
-            self.logger.verify_plot_creation(plot_path, f"{vehicle_id} Fuel Analysis")
+            # Verify plot creation once the background save has completed
+            save_plot(fig, plot_path,
+                      on_saved=partial(self.logger.verify_plot_creation, plot_path, f"{vehicle_id} Fuel Analysis"))
+            close_plot(fig)
 
         except Exception as e:
-            self.logger.error(f"❌ Failed to create fuel plot for {vehicle_id}: {e}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-            plt.close('all')  # Ensure cleanup
\ No newline at end of file
+            self.logger.error("❌ Failed to create fuel plot for %s: %s", vehicle_id, e, exc_info=True)
+            if fig is not None:
+                close_plot(fig)  # Ensure cleanup
\ No newline at end of file
@@ -7,6 +7,7 @@ Advanced odometer pattern analysis with moving average reset detection.
 
 import pandas as pd
 import numpy as np
+from shared.math_utils import calculate_moving_averages
 
 
 class OdometerAnalyzer:
@@ -19,17 +20,8 @@ class OdometerAnalyzer:
 
     def calculate_moving_averages(self, data_series, windows=[5, 10, 20]):
         """Calculate multiple moving averages for gradient analysis"""
-        moving_averages = {}
-
-        for window in windows:
-            if len(data_series) >= window:
-                ma = data_series.rolling(window=window, center=True).mean()
-                moving_averages[f'MA_{window}'] = ma
-            else:
-                # If insufficient data, create MA with available data
-                moving_averages[f'MA_{window}'] = data_series.rolling(window=len(data_series), center=True).mean()
-
-        return moving_averages
+        # Windows longer than the series use the available data
+        return calculate_moving_averages(data_series, windows)
 
     def analyze_odometer_patterns(self, vehicle_id, odometer_data):
         """Advanced odometer pattern analysis with moving average reset detection"""
@@ -67,7 +59,8 @@ class OdometerAnalyzer:
             context_ma_20 = moving_averages['MA_20'].iloc[context_window]
 
             # Classification logic based on moving average patterns
-            if len(context_ma_5.dropna()) > 5:
+            context_quality = int(context_ma_5.count())
+            if context_quality > 5:
                 ma_all_low = (context_ma_5 < 1000).sum() > 5  # Threshold for "low" readings
                 ma_recovery = context_ma_5.iloc[-3:].mean() > context_ma_5.iloc[:3].mean()
 
@@ -82,7 +75,7 @@ class OdometerAnalyzer:
                 'timestamp': timestamp,
                 'position': position,
                 'classification': classification,
-                'context_quality': len(context_ma_5.dropna())
+                'context_quality': context_quality
             })
 
         # Calculate comprehensive odometer statistics
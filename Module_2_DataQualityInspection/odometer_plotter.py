@@ -5,9 +5,9 @@ Extracted from original AutoAnalytiX DATAQUALITYINSPECTION_MODULE.plot_odometer_
 Creates professional odometer analysis plots with moving averages.
 """
 
-import matplotlib.pyplot as plt
-import traceback
+from functools import partial
 from pathlib import Path
+from shared.plot_utils import close_plot, create_figure, save_plot
 
 
 class OdometerPlotter:
@@ -24,11 +24,12 @@ class OdometerPlotter:
         if odometer_analysis is None:
             return
 
+        fig = None
         try:
             odometer_data = odometer_analysis['raw_data']
             moving_averages = odometer_analysis['moving_averages']
 
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(16, 12))
+            fig, (ax1, ax2) = create_figure(2, 1, figsize=(16, 12))
 
             # Plot 1: Odometer Time Series with Moving Averages
             ax1.plot(odometer_data['TIMESTAMP'], odometer_data['odometer'],
@@ -37,7 +38,7 @@ class OdometerPlotter:
             # Plot moving averages
             colors = ['red', 'green', 'purple']
             for i, (ma_name, ma_data) in enumerate(moving_averages.items()):
-                if len(ma_data.dropna()) > 0:
+                if ma_data.notna().any():
                     ax1.plot(odometer_data['TIMESTAMP'], ma_data,
                             color=colors[i % len(colors)], linewidth=2, label=ma_name)
 
@@ -74,17 +75,16 @@ class OdometerPlotter:
             ax2.legend()
             ax2.grid(True, alpha=0.3)
 
-            plt.tight_layout()
+            fig.tight_layout()
 
             # Save plot with error handling
             plot_path = self.reports_dir / "Plots" / "Odometer_Quality" / f"{vehicle_id}_odometer_analysis.pdf"
-            plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-            plt.close()
-
-            # Verify plot creation
-            self.logger.verify_plot_creation(plot_path, f"{vehicle_id} Odometer Analysis")
+            # Verify plot creation once the background save has completed
+            save_plot(fig, plot_path,
+                      on_saved=partial(self.logger.verify_plot_creation, plot_path, f"{vehicle_id} Odometer Analysis"))
+            close_plot(fig)
 
         except Exception as e:
-            self.logger.error(f"❌ Failed to create odometer plot for {vehicle_id}: {e}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-            plt.close('all')  # Ensure cleanup
\ No newline at end of file
+            self.logger.error("❌ Failed to create odometer plot for %s: %s", vehicle_id, e, exc_info=True)
+            if fig is not None:
+                close_plot(fig)  # Ensure cleanup
\ No newline at end of file
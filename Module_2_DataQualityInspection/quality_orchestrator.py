@@ -5,9 +5,12 @@ Extracted from original AutoAnalytiX DATAQUALITYINSPECTION_MODULE.execute_qualit
 Orchestrates comprehensive data quality inspection across all vehicles.
 """
 
+import os
 from pathlib import Path
 from collections import defaultdict
 from tqdm import tqdm
+from shared.directory_utils import ensure_directories
+from shared.plot_utils import wait_for_plots
 from .speed_analyzer import SpeedAnalyzer
 from .odometer_analyzer import OdometerAnalyzer
 from .fuel_analyzer import FuelAnalyzer
@@ -38,18 +41,15 @@ class DATAQUALITYINSPECTION_MODULE:
 
     def _setup_directories(self):
         """Setup organized directory structure for quality inspection"""
-        base_dir = Path("AutoAnalytiX__Reports")
+        base_dir = "AutoAnalytiX__Reports"
 
-        directories = [
-            base_dir / "Plots" / "Speed_Quality",
-            base_dir / "Plots" / "Odometer_Quality",
-            base_dir / "Plots" / "Fuel_Quality"
-        ]
+        ensure_directories([
+            os.path.join(base_dir, "Plots", "Speed_Quality"),
+            os.path.join(base_dir, "Plots", "Odometer_Quality"),
+            os.path.join(base_dir, "Plots", "Fuel_Quality")
+        ])
 
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
-
-        return base_dir
+        return Path(base_dir)
 
     def execute_quality_inspection(self):
         """Execute comprehensive data quality inspection across all vehicles"""
@@ -110,6 +110,9 @@ class DATAQUALITYINSPECTION_MODULE:
                 self.logger.log_quality_report("DataQualityInspection", vehicle_id, vehicle_issues)
                 inspection_summary['quality_issues_detected'] += 1
 
+        # Wait for background plot saves and verify them
+        wait_for_plots(self.logger)
+
         # Generate comprehensive inspection summary
         self.logger.info("✅ Data Quality Inspection Completed")
         self.logger.info(f"📊 Inspection Summary:")
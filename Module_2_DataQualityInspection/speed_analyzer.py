@@ -7,6 +7,10 @@ Advanced speed pattern analysis with acceleration distribution.
 
 import pandas as pd
 import numpy as np
+from shared.math_utils import calculate_basic_stats, calculate_percentiles, count_values_above
+
+# Divisor converting timedelta64 differences into float minutes
+ONE_MINUTE = np.timedelta64(1, 'm')
 
 
 class SpeedAnalyzer:
@@ -28,36 +32,41 @@ class SpeedAnalyzer:
         speed_values = speed_sorted['speed']
         timestamps = speed_sorted['TIMESTAMP']
 
-        # Calculate acceleration patterns (mph/min)
-        time_diffs = timestamps.diff().dt.total_seconds() / 60  # Convert to minutes
-        speed_changes = speed_values.diff().abs()
+        # Calculate acceleration patterns (mph/min) on the raw arrays
+        time_diffs = np.diff(timestamps.to_numpy(dtype='datetime64[ns]')) / ONE_MINUTE
+        speed_changes = np.abs(np.diff(speed_values.to_numpy(dtype=np.float64)))
 
         # Filter valid acceleration calculations (reasonable time gaps)
         valid_mask = (time_diffs > 0) & (time_diffs < 60)  # Between 0 and 60 minutes
-        valid_accelerations = (speed_changes / time_diffs)[valid_mask]
+        valid_accelerations = pd.Series(
+            speed_changes[valid_mask] / time_diffs[valid_mask],
+            index=speed_sorted.index[1:][valid_mask]
+        )
 
         if len(valid_accelerations) == 0:
             self.logger.warning(f"⚠️  {vehicle_id}: No valid acceleration data points")
             return None
 
         # Calculate comprehensive acceleration statistics
+        basic_stats = calculate_basic_stats(valid_accelerations)
+        percentiles = calculate_percentiles(valid_accelerations, [50, 95, 99])
         acceleration_stats = {
             'total_readings': len(speed_data),
             'valid_accelerations': len(valid_accelerations),
-            'mean_acceleration': valid_accelerations.mean(),
-            'std_acceleration': valid_accelerations.std(),
-            'max_acceleration': valid_accelerations.max(),
-            'percentile_95': valid_accelerations.quantile(0.95),
-            'percentile_99': valid_accelerations.quantile(0.99),
-            'median_acceleration': valid_accelerations.median()
+            'mean_acceleration': basic_stats['mean'],
+            'std_acceleration': basic_stats['std'],
+            'max_acceleration': basic_stats['max'],
+            'percentile_95': percentiles[95],
+            'percentile_99': percentiles[99],
+            'median_acceleration': percentiles[50]
         }
 
         # Threshold impact analysis for specific acceleration thresholds
         acceleration_thresholds = [10, 20, 30, 40, 50, 75, 100]
+        threshold_violations = count_values_above(valid_accelerations, acceleration_thresholds)
         threshold_analysis = {}
 
-        for threshold in acceleration_thresholds:
-            violations = (valid_accelerations > threshold).sum()
+        for threshold, violations in threshold_violations.items():
             threshold_analysis[threshold] = {
                 'violations': violations,
                 'percentage': violations / len(valid_accelerations) * 100 if len(valid_accelerations) > 0 else 0
@@ -67,7 +76,7 @@ class SpeedAnalyzer:
         data_quality_score = min(100, (len(valid_accelerations) / len(speed_data)) * 100)
 
         # Identify severe acceleration violations for logging
-        severe_violations = (valid_accelerations > 50).sum()
+        severe_violations = threshold_violations[50]
         if severe_violations > 0:
             self.logger.log_vehicle_violation(vehicle_id, "HIGH_ACCELERATION", {
                 "Violation Type": "Excessive Acceleration Events",
@@ -5,9 +5,9 @@ Extracted from original AutoAnalytiX DATAQUALITYINSPECTION_MODULE.plot_speed_ana
 Creates professional speed analysis plots with error handling.
 """
 
-import matplotlib.pyplot as plt
-import traceback
+from functools import partial
 from pathlib import Path
+from shared.plot_utils import close_plot, create_figure, save_plot
 
 
 class SpeedPlotter:
@@ -24,9 +24,10 @@ class SpeedPlotter:
         if speed_analysis is None:
             return
 
+        fig = None
         try:
             # Create acceleration distribution plot
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(16, 12))
+            fig, (ax1, ax2) = create_figure(2, 1, figsize=(16, 12))
 
             # Plot 1: Acceleration Distribution
             accelerations = speed_analysis['valid_accelerations']
@@ -72,17 +73,16 @@ class SpeedPlotter:
             ax2.legend(lines1 + lines2, labels1 + labels2, loc='upper right')
             ax2.grid(True, alpha=0.3)
 
-            plt.tight_layout()
+            fig.tight_layout()
 
             # Save plot with error handling
             plot_path = self.reports_dir / "Plots" / "Speed_Quality" / f"{vehicle_id}_speed_analysis.pdf"
-            plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-            plt.close()
-
-            # Verify plot creation
-            self.logger.verify_plot_creation(plot_path, f"{vehicle_id} Speed Analysis")
+            # Verify plot creation once the background save has completed
+            save_plot(fig, plot_path,
+                      on_saved=partial(self.logger.verify_plot_creation, plot_path, f"{vehicle_id} Speed Analysis"))
+            close_plot(fig)
 
         except Exception as e:
-            self.logger.error(f"❌ Failed to create speed plot for {vehicle_id}: {e}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-            plt.close('all')  # Ensure cleanup
\ No newline at end of file
+            self.logger.error("❌ Failed to create speed plot for %s: %s", vehicle_id, e, exc_info=True)
+            if fig is not None:
+                close_plot(fig)  # Ensure cleanup
\ No newline at end of file
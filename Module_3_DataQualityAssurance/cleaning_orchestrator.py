@@ -5,12 +5,14 @@ Extracted from original AutoAnalytiX DATAQUALITYASSURANCE_MODULE.execute_data_cl
 Orchestrates systematic data cleaning across all vehicles.
 """
 
+import os
 import pandas as pd
 from pathlib import Path
 from collections import defaultdict
 from tqdm import tqdm
 from datetime import datetime
 from shared.data_export import DataExporter
+from shared.directory_utils import ensure_directories
 from .speed_cleaner import SpeedCleaner
 from .odometer_cleaner import OdometerCleaner
 from .fuel_cleaner import FuelCleaner
@@ -37,27 +39,31 @@ class DATAQUALITYASSURANCE_MODULE:
 
     def _setup_directories(self):
         """Setup directory structure for data quality assurance"""
-        base_dir = Path("AutoAnalytiX__Reports")
+        base_dir = "AutoAnalytiX__Reports"
 
-        directories = [
-            base_dir / "Quality_Reports" / "Before_After",
-            base_dir / "Cleaned_Data_Exports"
-        ]
+        ensure_directories([
+            os.path.join(base_dir, "Quality_Reports", "Before_After"),
+            os.path.join(base_dir, "Cleaned_Data_Exports")
+        ])
 
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
-
-        return base_dir
+        return Path(base_dir)
 
     def export_cleaned_data(self, vehicle_id, cleaned_vehicle_data):
         """Export cleaned data to CSV files"""
         try:
             export_dir = self.reports_dir / "Cleaned_Data_Exports"
 
-            for meter_type, meter_data in cleaned_vehicle_data.items():
-                if not meter_data.empty:
-                    csv_path = export_dir / f"{vehicle_id}_{meter_type}_cleaned.csv"
-                    meter_data.to_csv(csv_path, index=False)
+            exports = [
+                (meter_data, export_dir / f"{vehicle_id}_{meter_type}_cleaned.csv",
+                 f"{vehicle_id} {meter_type} Cleaned Data")
+                for meter_type, meter_data in cleaned_vehicle_data.items()
+                if not meter_data.empty
+            ]
+
+            # Failed writes are logged by the exporter; track every file that was written
+            results = self.data_exporter.export_csvs_concurrently(exports)
+            for (_, csv_path, _), written in zip(exports, results):
+                if written:
                     self.logger.track_file_created(csv_path)
 
         except Exception as e:
@@ -6,6 +6,10 @@ Cleans fuel data by removing range violations and flagged anomalies.
 """
 
 import pandas as pd
+import numpy as np
+
+# Reading status categories, in category-code order
+FUEL_READING_STATUSES = ['VALID', 'MISSING', 'NEGATIVE_VIOLATION', 'OVER_100_VIOLATION']
 
 
 class FuelCleaner:
@@ -16,17 +20,25 @@ class FuelCleaner:
     def __init__(self, logger):
         self.logger = logger
 
+    def classify_fuel_readings(self, fuel_levels):
+        """Tag each fuel reading as VALID or with the range rule it violates"""
+        status_codes = np.select(
+            [fuel_levels.isna(), fuel_levels < 0, fuel_levels > 100],
+            [1, 2, 3],
+            default=0
+        )
+        return pd.Categorical.from_codes(status_codes, categories=FUEL_READING_STATUSES)
+
     def clean_fuel_data(self, vehicle_id, fuel_data, fuel_issues):
         """Clean fuel data by removing range violations and flagged anomalies"""
         if fuel_data.empty:
             return fuel_data, {}
 
         initial_count = len(fuel_data)
-        cleaned_fuel = fuel_data.copy()
 
         # Remove range violations (fuel < 0% OR fuel > 100%)
-        range_mask = (cleaned_fuel['fuel_level'] >= 0) & (cleaned_fuel['fuel_level'] <= 100)
-        cleaned_fuel = cleaned_fuel[range_mask]
+        fuel_status = self.classify_fuel_readings(fuel_data['fuel_level'])
+        cleaned_fuel = fuel_data[fuel_status == 'VALID']
 
         range_violations_removed = initial_count - len(cleaned_fuel)
 
@@ -37,6 +49,8 @@ class FuelCleaner:
         cleaning_summary = {
             'initial_records': initial_count,
             'range_violations_removed': range_violations_removed,
+            'negative_readings_removed': int((fuel_status == 'NEGATIVE_VIOLATION').sum()),
+            'over_100_readings_removed': int((fuel_status == 'OVER_100_VIOLATION').sum()),
             'final_records': len(cleaned_fuel),
             'data_retention_rate': len(cleaned_fuel) / initial_count * 100 if initial_count > 0 else 0
         }
@@ -6,6 +6,10 @@ Cleans odometer data by removing zero readings and faulty sensor readings.
 """
 
 import pandas as pd
+import numpy as np
+
+# Reading status categories, in category-code order
+ODOMETER_READING_STATUSES = ['VALID', 'ZERO_READING']
 
 
 class OdometerCleaner:
@@ -16,17 +20,25 @@ class OdometerCleaner:
     def __init__(self, logger):
         self.logger = logger
 
+    def classify_odometer_readings(self, odometer_values):
+        """Tag each odometer reading as VALID or ZERO_READING"""
+        status_codes = np.select(
+            [odometer_values == 0],
+            [1],
+            default=0
+        )
+        return pd.Categorical.from_codes(status_codes, categories=ODOMETER_READING_STATUSES)
+
     def clean_odometer_data(self, vehicle_id, odometer_data, odometer_issues):
         """Clean odometer data by removing zero readings and faulty sensor readings"""
         if odometer_data.empty:
             return odometer_data, {}
 
         initial_count = len(odometer_data)
-        cleaned_odometer = odometer_data.copy()
 
         # Remove all zero readings (as per specification)
-        zero_mask = cleaned_odometer['odometer'] != 0
-        cleaned_odometer = cleaned_odometer[zero_mask]
+        odometer_status = self.classify_odometer_readings(odometer_data['odometer'])
+        cleaned_odometer = odometer_data[odometer_status == 'VALID']
         zero_readings_removed = initial_count - len(cleaned_odometer)
 
         # Remove readings flagged as "FAULTY_SENSOR_READING" from Module 2 analysis
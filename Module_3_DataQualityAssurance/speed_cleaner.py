@@ -6,6 +6,10 @@ Cleans speed data (minimal cleaning - mostly validation).
 """
 
 import pandas as pd
+import numpy as np
+
+# Reading status categories, in category-code order
+SPEED_READING_STATUSES = ['VALID', 'MISSING', 'NEGATIVE_VIOLATION']
 
 
 class SpeedCleaner:
@@ -16,17 +20,25 @@ class SpeedCleaner:
     def __init__(self, logger):
         self.logger = logger
 
+    def classify_speed_readings(self, speed_values):
+        """Tag each speed reading as VALID or with the rule it violates"""
+        status_codes = np.select(
+            [speed_values.isna(), speed_values < 0],
+            [1, 2],
+            default=0
+        )
+        return pd.Categorical.from_codes(status_codes, categories=SPEED_READING_STATUSES)
+
     def clean_speed_data(self, vehicle_id, speed_data, speed_issues):
         """Clean speed data (minimal cleaning - mostly validation)"""
         if speed_data.empty:
             return speed_data, {}
 
         initial_count = len(speed_data)
-        cleaned_speed = speed_data.copy()
 
         # Remove clearly invalid speed readings (negative speeds)
-        valid_mask = cleaned_speed['speed'] >= 0
-        cleaned_speed = cleaned_speed[valid_mask]
+        speed_status = self.classify_speed_readings(speed_data['speed'])
+        cleaned_speed = speed_data[speed_status == 'VALID']
 
         invalid_removed = initial_count - len(cleaned_speed)
 
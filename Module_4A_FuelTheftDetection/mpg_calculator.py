@@ -23,24 +23,34 @@ class MPGCalculator:
             return sync_data
 
         mpg_data = sync_data.copy()
-        mpg_data['distance_delta'] = mpg_data['odometer'].diff()
-        mpg_data['fuel_delta'] = mpg_data['fuel_level'].diff() * -1  # Fuel decreases, so invert
-        mpg_data['fuel_gallons_consumed'] = (mpg_data['fuel_delta'] / 100) * tank_capacity
-        mpg_data['time_delta_hours'] = mpg_data['timestamp'].diff().dt.total_seconds() / 3600
+
+        # Window-to-window deltas on the raw arrays, reusing buffers via out=
+        odometer = mpg_data['odometer'].to_numpy(dtype=np.float64)
+        fuel_level = mpg_data['fuel_level'].to_numpy(dtype=np.float64)
+
+        distance_delta = np.diff(odometer, prepend=np.nan)
+        fuel_delta = np.diff(fuel_level, prepend=np.nan)
+        np.negative(fuel_delta, out=fuel_delta)  # Fuel decreases, so invert
+
+        fuel_gallons_consumed = np.divide(fuel_delta, 100)
+        np.multiply(fuel_gallons_consumed, tank_capacity, out=fuel_gallons_consumed)
 
         # Calculate MPG where fuel was actually consumed
-        mpg_data['calculated_mpg'] = np.where(
-            mpg_data['fuel_gallons_consumed'] > 0,
-            mpg_data['distance_delta'] / mpg_data['fuel_gallons_consumed'],
-            np.nan
-        )
+        fuel_consumed = fuel_gallons_consumed > 0
+        calculated_mpg = np.full(len(mpg_data), np.nan)
+        np.divide(distance_delta, fuel_gallons_consumed, out=calculated_mpg, where=fuel_consumed)
+
+        mpg_data['distance_delta'] = distance_delta
+        mpg_data['fuel_delta'] = fuel_delta
+        mpg_data['fuel_gallons_consumed'] = fuel_gallons_consumed
+        mpg_data['time_delta_hours'] = mpg_data['timestamp'].diff().dt.total_seconds() / 3600
+        mpg_data['calculated_mpg'] = calculated_mpg
 
         # Apply physics-based validation thresholds
-        mpg_data['mpg_validation'] = np.where(
-            mpg_data['calculated_mpg'].isna(), 'NO_FUEL_CONSUMPTION',
-            np.where(mpg_data['calculated_mpg'] > 50, 'FUEL_SENSOR_ERROR',
-                    np.where(mpg_data['calculated_mpg'] < 2, 'INVESTIGATE_POTENTIAL_THEFT',
-                            'NORMAL_OPERATION'))
+        mpg_data['mpg_validation'] = np.select(
+            [np.isnan(calculated_mpg), calculated_mpg > 50, calculated_mpg < 2],
+            ['NO_FUEL_CONSUMPTION', 'FUEL_SENSOR_ERROR', 'INVESTIGATE_POTENTIAL_THEFT'],
+            default='NORMAL_OPERATION'
         )
 
         # Log validation results
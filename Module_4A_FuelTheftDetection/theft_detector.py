@@ -5,7 +5,7 @@ Extracted from original AutoAnalytiX FUEL_THEFT_DETECTION_MODULE.detect_theft_ev
 Enhanced theft detection using cross-sensor validation and efficiency ratios.
 """
 
-import pandas as pd
+import numpy as np
 
 
 class TheftDetector:
@@ -20,50 +20,47 @@ class TheftDetector:
         """Enhanced theft detection using cross-sensor validation and efficiency ratios"""
         theft_events = []
 
-        # Focus on windows flagged for investigation
-        suspicious_windows = mpg_data[mpg_data['mpg_validation'] == 'INVESTIGATE_POTENTIAL_THEFT']
+        # Focus on windows flagged for investigation with actual fuel consumption
+        suspicious_windows = mpg_data[
+            (mpg_data['mpg_validation'] == 'INVESTIGATE_POTENTIAL_THEFT')
+            & mpg_data['calculated_mpg'].notna()
+            & (mpg_data['fuel_gallons_consumed'] > 0)
+        ]
 
-        for idx, window in suspicious_windows.iterrows():
-            if pd.isna(window['calculated_mpg']) or window['fuel_gallons_consumed'] <= 0:
-                continue
+        # Calculate efficiency ratios for threat assessment across all windows at once
+        if rated_mpg > 0:
+            efficiency_ratios = suspicious_windows['calculated_mpg'].to_numpy(dtype=np.float64) / rated_mpg
+        else:
+            efficiency_ratios = np.zeros(len(suspicious_windows))
 
-            # Calculate efficiency ratio for threat assessment
-            efficiency_ratio = window['calculated_mpg'] / rated_mpg if rated_mpg > 0 else 0
+        # Determine threat level based on efficiency ratio
+        threat_bands = [efficiency_ratios < 0.3, efficiency_ratios < 0.5, efficiency_ratios < 0.7]
+        threat_levels = np.select(threat_bands, ["CRITICAL", "HIGH", "MEDIUM"], default="LOW")
+        priorities = np.select(threat_bands, [1, 1, 2], default=3)
 
-            # Determine threat level based on efficiency ratio
-            if efficiency_ratio < 0.3:
-                threat_level = "CRITICAL"
-                priority = 1
-            elif efficiency_ratio < 0.5:
-                threat_level = "HIGH"
-                priority = 1
-            elif efficiency_ratio < 0.7:
-                threat_level = "MEDIUM"
-                priority = 2
-            else:
-                threat_level = "LOW"
-                priority = 3
+        for window, efficiency_ratio, threat_level, priority in zip(
+                suspicious_windows.itertuples(), efficiency_ratios, threat_levels.tolist(), priorities.tolist()):
 
             # Calculate estimated theft value
-            estimated_theft_gallons = window['fuel_gallons_consumed']
+            estimated_theft_gallons = window.fuel_gallons_consumed
             estimated_theft_value = estimated_theft_gallons * 5.00  # $5.00 per gallon
 
             # Create comprehensive theft event record
             theft_event = {
                 'vehicle_id': vehicle_id,
-                'timestamp': window['timestamp'],
-                'window_index': idx,
-                'fuel_drop_percent': window['fuel_delta'],
-                'fuel_gallons_consumed': window['fuel_gallons_consumed'],
-                'distance_traveled': window['distance_delta'],
-                'calculated_mpg': window['calculated_mpg'],
+                'timestamp': window.timestamp,
+                'window_index': window.Index,
+                'fuel_drop_percent': window.fuel_delta,
+                'fuel_gallons_consumed': window.fuel_gallons_consumed,
+                'distance_traveled': window.distance_delta,
+                'calculated_mpg': window.calculated_mpg,
                 'rated_mpg': rated_mpg,
                 'efficiency_ratio': efficiency_ratio,
                 'threat_level': threat_level,
                 'investigation_priority': priority,
                 'estimated_theft_value': estimated_theft_value,
-                'time_window_hours': window['time_delta_hours'],
-                'validation_flag': window['mpg_validation']
+                'time_window_hours': window.time_delta_hours,
+                'validation_flag': window.mpg_validation
             }
 
             theft_events.append(theft_event)
@@ -71,15 +68,15 @@ class TheftDetector:
             # Log theft event with detailed context
             self.logger.log_vehicle_violation(vehicle_id, "FUEL_THEFT_DETECTED", {
                 "Violation Type": f"Potential Fuel Theft - {threat_level} PRIORITY",
-                "Event Timestamp": str(window['timestamp']),
-                "Fuel Consumed": f"{window['fuel_gallons_consumed']:.2f} gallons ({window['fuel_delta']:.1f}%)",
-                "Distance Traveled": f"{window['distance_delta']:.1f} miles",
-                "Calculated MPG": f"{window['calculated_mpg']:.1f}",
+                "Event Timestamp": str(window.timestamp),
+                "Fuel Consumed": f"{window.fuel_gallons_consumed:.2f} gallons ({window.fuel_delta:.1f}%)",
+                "Distance Traveled": f"{window.distance_delta:.1f} miles",
+                "Calculated MPG": f"{window.calculated_mpg:.1f}",
                 "Rated MPG": f"{rated_mpg:.1f}",
                 "Efficiency Ratio": f"{efficiency_ratio:.3f}",
                 "Estimated Theft Value": f"${estimated_theft_value:.2f}",
                 "Investigation Priority": priority,
-                "Time Window": f"{window['time_delta_hours']:.1f} hours"
+                "Time Window": f"{window.time_delta_hours:.1f} hours"
             })
 
         return theft_events
\ No newline at end of file
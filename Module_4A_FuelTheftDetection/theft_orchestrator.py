@@ -5,11 +5,14 @@ Extracted from original AutoAnalytiX FUEL_THEFT_DETECTION_MODULE.execute_theft_d
 Orchestrates comprehensive fuel theft detection analysis.
 """
 
+import os
 import pandas as pd
 from pathlib import Path
 from collections import defaultdict
 from tqdm import tqdm
 from shared.data_export import DataExporter
+from shared.directory_utils import ensure_directories
+from shared.plot_utils import wait_for_plots
 from .time_synchronizer import TimeSynchronizer
 from .mpg_calculator import MPGCalculator
 from .theft_detector import TheftDetector
@@ -36,18 +39,15 @@ class FUEL_THEFT_DETECTION_MODULE:
 
     def _setup_directories(self):
         """Setup directory structure for theft detection analysis"""
-        base_dir = Path("AutoAnalytiX__Reports")
+        base_dir = "AutoAnalytiX__Reports"
 
-        directories = [
-            base_dir / "Theft_Detection",
-            base_dir / "Synchronized_Data",
-            base_dir / "Plots" / "Theft_Analysis",
-        ]
+        ensure_directories([
+            os.path.join(base_dir, "Theft_Detection"),
+            os.path.join(base_dir, "Synchronized_Data"),
+            os.path.join(base_dir, "Plots", "Theft_Analysis"),
+        ])
 
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
-
-        return base_dir
+        return Path(base_dir)
 
     def export_synchronized_data(self, vehicle_id, sync_data):
         """Export synchronized data to CSV"""
@@ -153,6 +153,9 @@ class FUEL_THEFT_DETECTION_MODULE:
             # Generate theft analysis plot
             self.theft_plotter.plot_theft_analysis(vehicle_id, mpg_data, theft_events)
 
+        # Wait for background plot saves and verify them
+        wait_for_plots(self.logger)
+
         # Generate comprehensive theft detection summary
         self.logger.info("✅ Fuel Theft Detection Analysis Completed")
         self.logger.info(f"🚨 Theft Detection Summary:")
@@ -5,10 +5,14 @@ Extracted from original AutoAnalytiX FUEL_THEFT_DETECTION_MODULE.plot_theft_anal
 Creates comprehensive theft analysis visualization with error handling.
 """
 
-import matplotlib.pyplot as plt
 import pandas as pd
-import traceback
+from functools import partial
 from pathlib import Path
+from types import MappingProxyType
+from shared.plot_utils import close_plot, create_figure, save_plot
+
+# Marker colour for each theft threat level
+THREAT_COLORS = MappingProxyType({'CRITICAL': 'darkred', 'HIGH': 'red', 'MEDIUM': 'orange', 'LOW': 'yellow'})
 
 
 class TheftPlotter:
@@ -25,23 +29,23 @@ class TheftPlotter:
         if mpg_data.empty:
             return
 
+        fig = None
         try:
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16))
+            fig, ((ax1, ax2), (ax3, ax4)) = create_figure(2, 2, figsize=(20, 16))
 
             # Plot 1: Fuel Level Time Series with Theft Events
             ax1.plot(mpg_data['timestamp'], mpg_data['fuel_level'],
                     color='blue', linewidth=2, label='Fuel Level (%)')
 
-            # Mark theft events
+            # Mark theft events with a single scatter call
             if theft_events:
-                threat_colors = {'CRITICAL': 'darkred', 'HIGH': 'red', 'MEDIUM': 'orange', 'LOW': 'yellow'}
-                for event in theft_events:
-                    event_time = event['timestamp']
-                    event_fuel = mpg_data[mpg_data['timestamp'] == event_time]['fuel_level'].iloc[0]
-                    color = threat_colors.get(event['threat_level'], 'gray')
-                    ax1.scatter(event_time, event_fuel, c=color, s=200, marker='X',
-                               edgecolors='black', linewidth=1,
-                               label=f"{event['threat_level']} Theft" if event == theft_events[0] else "")
+                event_times = [event['timestamp'] for event in theft_events]
+                fuel_by_time = mpg_data.drop_duplicates('timestamp').set_index('timestamp')['fuel_level']
+                event_fuels = fuel_by_time.loc[event_times].to_numpy()
+                event_colors = [THREAT_COLORS.get(event['threat_level'], 'gray') for event in theft_events]
+                ax1.scatter(event_times, event_fuels, c=event_colors, s=200, marker='X',
+                           edgecolors='black', linewidth=1,
+                           label=f"{theft_events[0]['threat_level']} Theft")
 
             ax1.set_ylabel('Fuel Level (%)', fontweight='bold')
             ax1.set_title(f'{vehicle_id} - Fuel Level with Theft Events', fontweight='bold')
@@ -91,27 +95,23 @@ class TheftPlotter:
                 ax4.grid(True, alpha=0.3, axis='y')
 
                 # Add value labels on bars
-                for bar, count in zip(bars, level_counts.values):
-                    height = bar.get_height()
-                    ax4.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                            str(count), ha='center', va='bottom', fontweight='bold')
+                ax4.bar_label(bars, fmt='%d', padding=3, fontweight='bold')
             else:
                 ax4.text(0.5, 0.5, 'No Theft Events Detected',
                         transform=ax4.transAxes, ha='center', va='center',
                         fontsize=16, fontweight='bold')
                 ax4.set_title(f'{vehicle_id} - No Theft Events', fontweight='bold')
 
-            plt.tight_layout()
+            fig.tight_layout()
 
             # Save plot with error handling
             plot_path = self.reports_dir / "Plots" / "Theft_Analysis" / f"{vehicle_id}_theft_analysis.pdf"
-            plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-            plt.close()
-
-            # Verify plot creation
-            self.logger.verify_plot_creation(plot_path, f"{vehicle_id} Theft Analysis")
+            # Verify plot creation once the background save has completed
+            save_plot(fig, plot_path,
+                      on_saved=partial(self.logger.verify_plot_creation, plot_path, f"{vehicle_id} Theft Analysis"))
+            close_plot(fig)
 
         except Exception as e:
-            self.logger.error(f"❌ Failed to create theft plot for {vehicle_id}: {e}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-            plt.close('all')  # Ensure cleanup
\ No newline at end of file
+            self.logger.error("❌ Failed to create theft plot for %s: %s", vehicle_id, e, exc_info=True)
+            if fig is not None:
+                close_plot(fig)  # Ensure cleanup
\ No newline at end of file
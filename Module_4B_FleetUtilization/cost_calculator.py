@@ -5,6 +5,16 @@ Extracted from original AutoAnalytiX FLEET_UTILIZATION_MODULE.calculate_idle_cos
 Calculates idle costs using the specified formula.
 """
 
+# Hourly idle cost rates
+FUEL_WASTE_RATE = 4.00  # $4/hour for fuel waste
+OPERATIONAL_RATE = 30.00  # $30/hour for operational cost
+IDLE_COST_PER_HOUR = FUEL_WASTE_RATE + OPERATIONAL_RATE  # $34/hour combined
+
+
+def calculate_idle_cost(idle_hours):
+    """Split idle hours into (fuel waste, operational, total) cost"""
+    return idle_hours * FUEL_WASTE_RATE, idle_hours * OPERATIONAL_RATE, idle_hours * IDLE_COST_PER_HOUR
+
 
 class CostCalculator:
     """
@@ -31,9 +41,7 @@ class CostCalculator:
         total_idle_hours = sum(period['duration_hours'] for period in idle_periods)
 
         # Apply specified cost formula: Idle_Hours × $34/hour
-        fuel_waste_cost = total_idle_hours * 4.00  # $4/hour for fuel waste
-        operational_cost = total_idle_hours * 30.00  # $30/hour for operational cost
-        total_idle_cost = total_idle_hours * 34.00  # Combined cost
+        fuel_waste_cost, operational_cost, total_idle_cost = calculate_idle_cost(total_idle_hours)
 
         # Calculate additional statistics
         idle_durations = [period['duration_hours'] for period in idle_periods]
@@ -48,7 +56,7 @@ class CostCalculator:
             'idle_events': len(idle_periods),
             'longest_idle_hours': longest_idle,
             'average_idle_duration': average_idle,
-            'cost_per_hour': 34.00,
+            'cost_per_hour': IDLE_COST_PER_HOUR,
             'idle_periods': idle_periods
         }
 
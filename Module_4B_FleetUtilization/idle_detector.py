@@ -5,6 +5,13 @@ Extracted from original AutoAnalytiX FLEET_UTILIZATION_MODULE.identify_idle_peri
 Identifies idle periods: speed = 0 for >5 consecutive minutes.
 """
 
+import numpy as np
+
+# Time unit conversions and the idle duration threshold
+SECONDS_PER_MINUTE = 60
+MINUTES_PER_HOUR = 60
+MIN_IDLE_MINUTES = 5
+
 
 class IdleDetector:
     """
@@ -19,42 +26,33 @@ class IdleDetector:
         if speed_data.empty:
             return []
 
-        speed_sorted = speed_data.sort_values('TIMESTAMP').copy()
-        speed_sorted['is_idle'] = speed_sorted['speed'] == 0
-
-        idle_periods = []
-        current_idle_start = None
-
-        for idx, row in speed_sorted.iterrows():
-            if row['is_idle']:
-                if current_idle_start is None:
-                    current_idle_start = row['TIMESTAMP']
-            else:
-                if current_idle_start is not None:
-                    idle_duration = (row['TIMESTAMP'] - current_idle_start).total_seconds() / 60  # minutes
-
-                    # Only record idle periods >5 minutes as specified
-                    if idle_duration > 5:
-                        idle_periods.append({
-                            'start_time': current_idle_start,
-                            'end_time': row['TIMESTAMP'],
-                            'duration_minutes': idle_duration,
-                            'duration_hours': idle_duration / 60
-                        })
-
-                    current_idle_start = None
-
-        # Handle case where data ends during idle period
-        if current_idle_start is not None:
-            last_timestamp = speed_sorted['TIMESTAMP'].iloc[-1]
-            idle_duration = (last_timestamp - current_idle_start).total_seconds() / 60
-
-            if idle_duration > 5:
-                idle_periods.append({
-                    'start_time': current_idle_start,
-                    'end_time': last_timestamp,
-                    'duration_minutes': idle_duration,
-                    'duration_hours': idle_duration / 60
-                })
-
-        return idle_periods
\ No newline at end of file
+        speed_sorted = speed_data.sort_values('TIMESTAMP')
+        timestamps = speed_sorted['TIMESTAMP']
+        is_idle = (speed_sorted['speed'] == 0).to_numpy()
+
+        # Locate runs of consecutive idle readings: each run starts at its first idle
+        # reading and ends at the next non-idle reading (or the last reading)
+        run_edges = np.diff(np.concatenate(([0], is_idle.astype(np.int8), [0])))
+        run_starts = np.flatnonzero(run_edges == 1)
+        run_ends = np.minimum(np.flatnonzero(run_edges == -1), len(is_idle) - 1)
+
+        start_times = timestamps.iloc[run_starts].reset_index(drop=True)
+        end_times = timestamps.iloc[run_ends].reset_index(drop=True)
+        idle_durations = (end_times - start_times).dt.total_seconds() / SECONDS_PER_MINUTE  # minutes
+
+        # Only record idle periods >5 minutes as specified
+        long_idle = idle_durations > MIN_IDLE_MINUTES
+
+        return [
+            {
+                'start_time': start_time,
+                'end_time': end_time,
+                'duration_minutes': idle_duration,
+                'duration_hours': idle_duration / MINUTES_PER_HOUR
+            }
+            for start_time, end_time, idle_duration in zip(
+                start_times[long_idle].tolist(),
+                end_times[long_idle].tolist(),
+                idle_durations[long_idle].tolist()
+            )
+        ]
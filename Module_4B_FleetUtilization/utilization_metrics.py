@@ -6,6 +6,11 @@ Calculates comprehensive utilization metrics.
 """
 
 
+def calculate_percentage(part_hours, total_hours):
+    """Share of total_hours covered by part_hours, 0 when there is no time span"""
+    return part_hours / total_hours * 100 if total_hours > 0 else 0
+
+
 class UtilizationMetrics:
     """
     Utilization metrics functionality extracted from original FLEET_UTILIZATION_MODULE.
@@ -20,16 +25,16 @@ class UtilizationMetrics:
             return {}
 
         # Calculate total operating time
-        speed_sorted = speed_data.sort_values('TIMESTAMP')
-        total_time_span = (speed_sorted['TIMESTAMP'].max() - speed_sorted['TIMESTAMP'].min()).total_seconds() / 3600  # hours
+        timestamps = speed_data['TIMESTAMP']
+        total_time_span = (timestamps.max() - timestamps.min()).total_seconds() / 3600  # hours
 
         # Calculate active vs idle time
         total_idle_hours = idle_analysis['total_idle_hours']
         active_hours = total_time_span - total_idle_hours
 
         # Calculate utilization percentage
-        utilization_percentage = (active_hours / total_time_span * 100) if total_time_span > 0 else 0
-        idle_percentage = (total_idle_hours / total_time_span * 100) if total_time_span > 0 else 0
+        utilization_percentage = calculate_percentage(active_hours, total_time_span)
+        idle_percentage = calculate_percentage(total_idle_hours, total_time_span)
 
         # Calculate efficiency scores
         efficiency_score = max(0, min(100, utilization_percentage))  # 0-100 scale
@@ -5,11 +5,14 @@ Extracted from original AutoAnalytiX FLEET_UTILIZATION_MODULE.execute_utilizatio
 Orchestrates comprehensive fleet utilization analysis.
 """
 
+import os
 import pandas as pd
 from pathlib import Path
 from collections import defaultdict
 from tqdm import tqdm
 from shared.data_export import DataExporter
+from shared.directory_utils import ensure_directories
+from shared.plot_utils import wait_for_plots
 from .idle_detector import IdleDetector
 from .cost_calculator import CostCalculator
 from .utilization_metrics import UtilizationMetrics
@@ -36,30 +39,26 @@ class FLEET_UTILIZATION_MODULE:
 
     def _setup_directories(self):
         """Setup directory structure for utilization analysis"""
-        base_dir = Path("AutoAnalytiX__Reports")
+        base_dir = "AutoAnalytiX__Reports"
 
-        directories = [
-            base_dir / "Utilization_Analysis",
-            base_dir / "Plots" / "Utilization",
-        ]
+        ensure_directories([
+            os.path.join(base_dir, "Utilization_Analysis"),
+            os.path.join(base_dir, "Plots", "Utilization"),
+        ])
 
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
-
-        return base_dir
+        return Path(base_dir)
 
     def export_utilization_data(self, vehicle_id, idle_analysis, utilization_metrics):
         """Export utilization analysis for Fleet Utilization module"""
         try:
             export_dir = self.reports_dir / "Utilization_Analysis"
-            all_successful = True
+            exports = []
 
             # Export idle periods if available
             if idle_analysis['idle_periods']:
                 idle_df = pd.DataFrame(idle_analysis['idle_periods'])
                 idle_path = export_dir / f"{vehicle_id}_idle_periods.csv"
-                idle_df.to_csv(idle_path, index=False)
-                self.logger.track_file_created(idle_path)
+                exports.append((idle_df, idle_path, f"{vehicle_id} Idle Periods"))
 
             # Export utilization summary
             summary_data = {
@@ -71,10 +70,15 @@ class FLEET_UTILIZATION_MODULE:
             }
             summary_df = pd.DataFrame(summary_data)
             summary_path = export_dir / f"{vehicle_id}_utilization_summary.csv"
-            summary_df.to_csv(summary_path, index=False)
-            self.logger.track_file_created(summary_path)
+            exports.append((summary_df, summary_path, f"{vehicle_id} Utilization Summary"))
+
+            # Failed writes are logged by the exporter; track every file that was written
+            results = self.data_exporter.export_csvs_concurrently(exports)
+            for (_, csv_path, _), written in zip(exports, results):
+                if written:
+                    self.logger.track_file_created(csv_path)
 
-            return all_successful
+            return all(results)
 
         except Exception as e:
             self.logger.error(f"Failed to export utilization data for {vehicle_id}: {e}")
@@ -147,6 +151,9 @@ class FLEET_UTILIZATION_MODULE:
                                f"${idle_analysis['total_idle_cost']:.2f} cost, "
                                f"{utilization_metrics.get('utilization_percentage', 0):.1f}% utilization")
 
+        # Wait for background plot saves and verify them
+        wait_for_plots(self.logger)
+
         # Calculate fleet averages
         if utilization_scores:
             utilization_summary['fleet_average_utilization'] = sum(utilization_scores) / len(utilization_scores)
@@ -5,9 +5,9 @@ Extracted from original AutoAnalytiX FLEET_UTILIZATION_MODULE.plot_utilization_a
 Creates comprehensive utilization analysis visualization.
 """
 
-import matplotlib.pyplot as plt
-import traceback
+from functools import partial
 from pathlib import Path
+from shared.plot_utils import close_plot, create_figure, save_plot
 from .savings_projector import SavingsProjector
 
 
@@ -26,18 +26,28 @@ class UtilizationPlotter:
         if speed_data.empty:
             return
 
+        fig = None
         try:
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16))
+            fig, ((ax1, ax2), (ax3, ax4)) = create_figure(2, 2, figsize=(20, 16))
 
             # Plot 1: Speed Time Series with Idle Periods
             speed_sorted = speed_data.sort_values('TIMESTAMP')
             ax1.plot(speed_sorted['TIMESTAMP'], speed_sorted['speed'],
                     color='blue', alpha=0.7, linewidth=1, label='Speed')
 
-            # Highlight idle periods
-            for period in idle_analysis['idle_periods']:
-                ax1.axvspan(period['start_time'], period['end_time'],
-                           color='red', alpha=0.3, label='Idle Period' if period == idle_analysis['idle_periods'][0] else "")
+            # Highlight idle periods as one full-height span collection
+            idle_periods = idle_analysis['idle_periods']
+            if idle_periods:
+                import matplotlib.dates as mdates
+                from matplotlib.collections import PolyCollection
+
+                span_starts = mdates.date2num([period['start_time'] for period in idle_periods])
+                span_ends = mdates.date2num([period['end_time'] for period in idle_periods])
+                idle_spans = PolyCollection(
+                    [[(start, 0), (start, 1), (end, 1), (end, 0)] for start, end in zip(span_starts, span_ends)],
+                    facecolors='red', edgecolors='red', alpha=0.3, label='Idle Period',
+                    transform=ax1.get_xaxis_transform())
+                ax1.add_collection(idle_spans, autolim=False)
 
             ax1.set_ylabel('Speed (mph)', fontweight='bold')
             ax1.set_title(f'{vehicle_id} - Speed Profile with Idle Periods', fontweight='bold')
@@ -63,10 +73,7 @@ class UtilizationPlotter:
             ax3.grid(True, alpha=0.3, axis='y')
 
             # Add value labels on bars
-            for bar, value in zip(bars, cost_values):
-                height = bar.get_height()
-                ax3.text(bar.get_x() + bar.get_width()/2., height + max(cost_values)*0.01,
-                        f'${value:.2f}', ha='center', va='bottom', fontweight='bold')
+            ax3.bar_label(bars, fmt='$%.2f', padding=3, fontweight='bold')
 
             # Plot 4: Savings Potential
             savings_scenarios = self.savings_projector.calculate_savings_projections(idle_analysis)
@@ -82,22 +89,18 @@ class UtilizationPlotter:
             ax4.grid(True, alpha=0.3, axis='y')
 
             # Add value labels on bars
-            for bar, value in zip(bars, savings_values):
-                height = bar.get_height()
-                ax4.text(bar.get_x() + bar.get_width()/2., height + max(savings_values)*0.01,
-                        f'${value:.0f}', ha='center', va='bottom', fontweight='bold')
+            ax4.bar_label(bars, fmt='$%.0f', padding=3, fontweight='bold')
 
-            plt.tight_layout()
+            fig.tight_layout()
 
             # Save plot with error handling
             plot_path = self.reports_dir / "Plots" / "Utilization" / f"{vehicle_id}_utilization_analysis.pdf"
-            plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-            plt.close()
-
-            # Verify plot creation
-            self.logger.verify_plot_creation(plot_path, f"{vehicle_id} Utilization Analysis")
+            # Verify plot creation once the background save has completed
+            save_plot(fig, plot_path,
+                      on_saved=partial(self.logger.verify_plot_creation, plot_path, f"{vehicle_id} Utilization Analysis"))
+            close_plot(fig)
 
         except Exception as e:
-            self.logger.error(f"❌ Failed to create utilization plot for {vehicle_id}: {e}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-            plt.close('all')  # Ensure cleanup
\ No newline at end of file
+            self.logger.error("❌ Failed to create utilization plot for %s: %s", vehicle_id, e, exc_info=True)
+            if fig is not None:
+                close_plot(fig)  # Ensure cleanup
\ No newline at end of file
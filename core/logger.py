@@ -8,6 +8,7 @@ FIXED: Replaced Unicode emojis with ASCII-safe alternatives for Windows compatib
 
 import logging
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 
@@ -15,10 +16,13 @@ from datetime import datetime
 class ProfessionalLogger:
     """Enterprise-grade logging system for fleet analytics"""
 
+    __slots__ = ('base_dir', 'files_created', '_files_created_set', 'log_dirs', '_logger')
+
     def __init__(self, base_dir="AutoAnalytiX__Reports"):
         self.base_dir = Path(base_dir)
         self.setup_logging_infrastructure()
         self.files_created = []  # Track all files created
+        self._files_created_set = set()  # Fast duplicate check for files_created
 
     def setup_logging_infrastructure(self):
         """Initialize comprehensive logging system"""
@@ -32,8 +36,9 @@ class ProfessionalLogger:
         }
 
         for log_dir in self.log_dirs.values():
-            log_dir.mkdir(parents=True, exist_ok=True)
-            print(f"✅ Created directory: {log_dir}")
+            if not log_dir.exists():
+                log_dir.mkdir(parents=True, exist_ok=True)
+                print(f"✅ Created directory: {log_dir}")
 
         # Setup main system logger
         self._logger = logging.getLogger('AutoAnalytiX')
@@ -65,50 +70,62 @@ class ProfessionalLogger:
         self._logger.info("AutoAnalytiX v1.0 - Enhanced Fleet Analytics Platform")
         self._logger.info("=" * 80)
 
-    def track_file_created(self, file_path):
-        """Track files created for verification"""
-        self.files_created.append(str(file_path))
-        if Path(file_path).exists():
-            size = Path(file_path).stat().st_size
-            self._logger.info(f"✅ File created: {file_path} ({size} bytes)")
-        else:
-            self._logger.error(f"❌ File NOT created: {file_path}")
+    def track_file_created(self, file_path, size=None):
+        """Track files created for verification; pass size when it is already known"""
+        # Files such as per-vehicle violation logs are appended to repeatedly;
+        # list each one only once
+        file_key = str(file_path)
+        if file_key not in self._files_created_set:
+            self._files_created_set.add(file_key)
+            self.files_created.append(file_key)
+
+        if size is None:
+            try:
+                size = os.stat(file_path).st_size
+            except FileNotFoundError:
+                self._logger.error("❌ File NOT created: %s", file_path)
+                return
+
+        self._logger.info("✅ File created: %s (%d bytes)", file_path, size)
 
     def verify_plot_creation(self, plot_path, plot_name):
         """Verify plot was actually created and has content"""
         try:
-            if Path(plot_path).exists():
-                size = Path(plot_path).stat().st_size
-                if size > 1000:  # Reasonable minimum size for a plot
-                    self._logger.info(f"✅ Plot saved: {plot_name} ({size} bytes)")
-                    self.track_file_created(plot_path)
-                    return True
-                else:
-                    self._logger.error(f"❌ Plot file too small: {plot_name} ({size} bytes)")
+            try:
+                size = os.stat(plot_path).st_size
+            except FileNotFoundError:
+                self._logger.error("❌ Plot NOT created: %s", plot_name)
+                return False
+
+            if size > 1000:  # Reasonable minimum size for a plot
+                self._logger.info("✅ Plot saved: %s (%d bytes)", plot_name, size)
+                self.track_file_created(plot_path, size)
+                return True
             else:
-                self._logger.error(f"❌ Plot NOT created: {plot_name}")
+                self._logger.error("❌ Plot file too small: %s (%d bytes)", plot_name, size)
             return False
         except Exception as e:
-            self._logger.error(f"❌ Error verifying plot {plot_name}: {e}")
+            self._logger.error("❌ Error verifying plot %s: %s", plot_name, e)
             return False
 
-    # Add wrapper methods to expose internal logger methods
-    def info(self, message):
-        self._logger.info(message)
+    # Add wrapper methods to expose internal logger methods; extra arguments
+    # are passed through so messages can be formatted lazily by logging
+    def info(self, message, *args, **kwargs):
+        self._logger.info(message, *args, **kwargs)
 
-    def warning(self, message):
-        self._logger.warning(message)
+    def warning(self, message, *args, **kwargs):
+        self._logger.warning(message, *args, **kwargs)
 
-    def error(self, message):
-        self._logger.error(message)
+    def error(self, message, *args, **kwargs):
+        self._logger.error(message, *args, **kwargs)
 
-    def debug(self, message):
-        self._logger.debug(message)
+    def debug(self, message, *args, **kwargs):
+        self._logger.debug(message, *args, **kwargs)
 
     def log_module_start(self, module_name, description):
         """Log the start of a major module"""
         self._logger.info("=" * 60)
-        self._logger.info(f"[MODULE {module_name}] {description}")
+        self._logger.info("[MODULE %s] %s", module_name, description)
         self._logger.info("=" * 60)
 
     def log_vehicle_violation(self, vehicle_id, violation_type, details):
@@ -116,22 +133,25 @@ class ProfessionalLogger:
         vehicle_log_path = self.log_dirs['vehicle'] / f"{vehicle_id}_violations.log"
 
         try:
+            separator = "=" * 80
+            entry = (
+                f"\n{separator}\n"
+                f"🚨 {violation_type.upper()} VIOLATION DETECTED\n"
+                f"Vehicle ID: {vehicle_id}\n"
+                f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"{separator}\n"
+                + "".join(f"{key}: {value}\n" for key, value in details.items())
+                + f"{separator}\n"
+            )
+
+            # Append the whole entry with a single write
             with open(vehicle_log_path, 'a', encoding='utf-8') as f:
-                f.write(f"\n{'='*80}\n")
-                f.write(f"🚨 {violation_type.upper()} VIOLATION DETECTED\n")
-                f.write(f"Vehicle ID: {vehicle_id}\n")
-                f.write(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"{'='*80}\n")
-
-                for key, value in details.items():
-                    f.write(f"{key}: {value}\n")
-
-                f.write(f"{'='*80}\n")
+                f.write(entry)
 
             self.track_file_created(vehicle_log_path)
-            self._logger.debug(f"Violation logged for {vehicle_id}: {violation_type}")
+            self._logger.debug("Violation logged for %s: %s", vehicle_id, violation_type)
         except Exception as e:
-            self._logger.error(f"Failed to log violation for {vehicle_id}: {e}")
+            self._logger.error("Failed to log violation for %s: %s", vehicle_id, e)
 
     def log_quality_report(self, module_name, vehicle_id, report_data):
         """Log data quality reports"""
@@ -142,26 +162,31 @@ class ProfessionalLogger:
                 json.dump(report_data, f, indent=2, default=str)
 
             self.track_file_created(quality_log_path)
-            self._logger.debug(f"Quality report saved: {quality_log_path}")
+            self._logger.debug("Quality report saved: %s", quality_log_path)
         except Exception as e:
-            self._logger.error(f"Failed to save quality report for {vehicle_id}: {e}")
+            self._logger.error("Failed to save quality report for %s: %s", vehicle_id, e)
 
     def generate_files_summary(self):
         """Generate summary of all files created"""
         summary_path = self.base_dir / "Files_Created_Summary.txt"
         try:
+            lines = [
+                "AutoAnalytiX v1.0 - Files Created Summary\n",
+                "=" * 50 + "\n\n",
+                f"Total files created: {len(self.files_created)}\n\n"
+            ]
+
+            for i, file_path in enumerate(self.files_created, 1):
+                try:
+                    size = os.stat(file_path).st_size
+                except FileNotFoundError:
+                    lines.append(f"{i:3d}. {file_path} (NOT FOUND)\n")
+                else:
+                    lines.append(f"{i:3d}. {file_path} ({size} bytes)\n")
+
             with open(summary_path, 'w', encoding='utf-8') as f:
-                f.write("AutoAnalytiX v1.0 - Files Created Summary\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(f"Total files created: {len(self.files_created)}\n\n")
-
-                for i, file_path in enumerate(self.files_created, 1):
-                    if Path(file_path).exists():
-                        size = Path(file_path).stat().st_size
-                        f.write(f"{i:3d}. {file_path} ({size} bytes)\n")
-                    else:
-                        f.write(f"{i:3d}. {file_path} (NOT FOUND)\n")
-
-            self._logger.info(f"📋 Files summary created: {summary_path}")
+                f.write("".join(lines))
+
+            self._logger.info("📋 Files summary created: %s", summary_path)
         except Exception as e:
-            self._logger.error(f"Failed to create files summary: {e}")
\ No newline at end of file
+            self._logger.error("Failed to create files summary: %s", e)
\ No newline at end of file
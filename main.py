@@ -9,24 +9,10 @@ Orchestrates the complete AutoAnalytiX pipeline.
 import matplotlib
 matplotlib.use('Agg')
 
-# Core imports
-import sys
-from pathlib import Path
-
-# Add module directories to Python path
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir / "core"))
-sys.path.insert(0, str(current_dir / "shared"))
-sys.path.insert(0, str(current_dir / "reports"))
-sys.path.insert(0, str(current_dir / "Module-1_ETL"))
-sys.path.insert(0, str(current_dir / "Module-2_DataQualityInspection"))
-sys.path.insert(0, str(current_dir / "Module-3_DataQualityAssurance"))
-sys.path.insert(0, str(current_dir / "Module-4A_FuelTheftDetection"))
-sys.path.insert(0, str(current_dir / "Module-4B_FleetUtilization"))
-
 # Import core modules
 from core.logger import ProfessionalLogger
 from reports.executive_summary import generate_executive_summary
+from shared.plot_utils import close_cached_figures
 
 # Import module orchestrators
 from Module_1_ETL.etl_orchestrator import ETL_MODULE
@@ -87,6 +73,9 @@ def main():
 
         utilization_analysis, utilization_summary = utilization_analyzer.execute_utilization_analysis()
 
+        # Release figures kept for reuse across plots
+        close_cached_figures()
+
         # Generate Executive Summary
         generate_executive_summary(logger, theft_summary, utilization_summary)
 
@@ -30,6 +30,12 @@ from pathlib import Path
 
 class AutoAnalytiXSetup:
     """Setup and execution manager for AutoAnalytiX project"""
+
+    __slots__ = (
+        'project_root', 'venv_name', 'venv_path', 'requirements_file', 'main_script',
+        'is_windows', 'python_executable', 'pip_executable',
+        'venv_python', 'venv_pip', 'activate_script', 'venv_created'
+    )
     
     def __init__(self):
         self.project_root = Path(__file__).parent
@@ -52,6 +58,9 @@ class AutoAnalytiXSetup:
             self.venv_pip = self.venv_path / "bin" / "pip"
             self.activate_script = self.venv_path / "bin" / "activate"
 
+        # Set once a fresh virtual environment has been created in this run
+        self.venv_created = False
+
     def print_header(self):
         """Print setup header"""
         print("=" * 80)
@@ -119,6 +128,7 @@ class AutoAnalytiXSetup:
                 self.python_executable, "-m", "venv", str(self.venv_path)
             ], check=True, capture_output=True, text=True)
             
+            self.venv_created = True
             print("✅ Virtual environment created successfully")
             return True
             
@@ -137,17 +147,23 @@ class AutoAnalytiXSetup:
             return False
         
         try:
-            # Upgrade pip first
-            print("   Upgrading pip...")
-            subprocess.run([
-                str(self.venv_python), "-m", "pip", "install", "--upgrade", "pip"
-            ], check=True, capture_output=True, text=True)
+            # Upgrade pip only in a freshly created environment; an existing
+            # environment already had its pip upgraded when it was created
+            if self.venv_created:
+                print("   Upgrading pip...")
+                subprocess.run([
+                    str(self.venv_python), "-m", "pip", "install",
+                    "--disable-pip-version-check", "--no-input", "--upgrade", "pip"
+                ], check=True, capture_output=True)
             
-            # Install requirements
+            # Install requirements, leaving already satisfied packages untouched
             print("   Installing project dependencies...")
-            result = subprocess.run([
-                str(self.venv_pip), "install", "-r", str(self.requirements_file)
-            ], check=True, capture_output=True, text=True)
+            subprocess.run([
+                str(self.venv_python), "-m", "pip", "install",
+                "--disable-pip-version-check", "--no-input",
+                "--upgrade-strategy", "only-if-needed",
+                "-r", str(self.requirements_file)
+            ], check=True, capture_output=True)
             
             print("✅ Dependencies installed successfully")
             
@@ -166,7 +182,7 @@ class AutoAnalytiXSetup:
         except subprocess.CalledProcessError as e:
             print(f"❌ ERROR: Failed to install dependencies")
             print(f"   Command: {' '.join(e.cmd)}")
-            print(f"   Error: {e.stderr}")
+            print(f"   Error: {e.stderr.decode(errors='replace') if e.stderr else ''}")
             return False
 
     def check_data_directory(self):
@@ -241,11 +257,20 @@ class AutoAnalytiXSetup:
                 ("Logs", "📝")
             ]
             
+            # One walk over the reports tree, bucketed by top-level subdirectory
+            base = os.fspath(reports_dir)
+            base_len = len(base) + 1
+            file_counts = {}
+            for root, dirs, files in os.walk(base):
+                if root == base:
+                    file_counts = dict.fromkeys(dirs, 0)
+                    continue
+                top_level = root[base_len:].split(os.sep, 1)[0]
+                file_counts[top_level] += sum(1 for name in files if "." in name)
+            
             for subdir, icon in subdirs:
-                subdir_path = reports_dir / subdir
-                if subdir_path.exists():
-                    file_count = len(list(subdir_path.rglob("*.*")))
-                    print(f"{icon} {subdir}: {file_count} files")
+                if subdir in file_counts:
+                    print(f"{icon} {subdir}: {file_counts[subdir]} files")
             
             # Check for executive summary
             exec_summary = reports_dir / "Executive_Summary.txt"
@@ -10,9 +10,48 @@ data validation, and mathematical operations.
 __version__ = "1.0.0"
 __author__ = "AutoAnalytiX Team"
 
-# Import key classes and functions for easy access
-from .data_export import DataExporter
+import importlib
+
+# Key classes for easy access, imported lazily on first use (PEP 562) so that
+# importing a single submodule does not pull in pandas/numpy through this package
+_LAZY_EXPORTS = {
+    'DataExporter': '.data_export',
+    'ExportRecord': '.data_export',
+    'calculate_basic_stats': '.math_utils',
+    'calculate_moving_averages': '.math_utils',
+    'calculate_percentiles': '.math_utils',
+    'count_values_above': '.math_utils',
+    'ensure_directories': '.directory_utils',
+    'close_cached_figures': '.plot_utils',
+    'close_plot': '.plot_utils',
+    'create_figure': '.plot_utils',
+    'save_plot': '.plot_utils',
+    'wait_for_plots': '.plot_utils'
+}
 
 __all__ = [
-    'DataExporter'
-]
\ No newline at end of file
+    'DataExporter',
+    'ExportRecord',
+    'calculate_basic_stats',
+    'calculate_moving_averages',
+    'calculate_percentiles',
+    'count_values_above',
+    'ensure_directories',
+    'close_cached_figures',
+    'close_plot',
+    'create_figure',
+    'save_plot',
+    'wait_for_plots'
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
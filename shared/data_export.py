@@ -6,11 +6,124 @@ Provides consistent export methods with error handling and file tracking.
 """
 
 import pandas as pd
+import numpy as np
+import csv
 import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, NamedTuple, Optional, Union
 from datetime import datetime
 
+from .directory_utils import ensure_directories
+
+try:
+    import orjson
+except ImportError:  # optional dependency; fall back to the stdlib encoder
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2
+
+# Integer range orjson can serialize
+_ORJSON_MIN_INT = -(1 << 63)
+_ORJSON_MAX_INT = (1 << 64) - 1
+
+# Rows formatted per batch when writing CSV files
+_CSV_CHUNK_ROWS = 50_000
+
+# Fast compression settings for compressed CSV exports, keyed by file suffix
+_CSV_COMPRESSION_BY_SUFFIX = {
+    '.gz': {'method': 'gzip', 'compresslevel': 1},
+    '.zst': {'method': 'zstd', 'level': 3},
+}
+
+# Buffer size for export file handles (fewer write syscalls on large files)
+_WRITE_BUFFER_BYTES = 1 << 20
+
+# Upper bound on concurrent file writes for multi-file exports
+_MAX_EXPORT_WORKERS = 8
+
+
+class _OrjsonMismatch(Exception):
+    """Raised when orjson would not reproduce the standard json encoder's output."""
+
+
+def _to_json_key(key) -> str:
+    """Convert a dict key the way json.dump does (it never applies default to keys)."""
+    if isinstance(key, str):
+        if not key.isascii():
+            raise _OrjsonMismatch
+        return str.__str__(key)
+    if isinstance(key, float):
+        if not math.isfinite(key):
+            raise _OrjsonMismatch
+        return float.__repr__(key)
+    if key is True:
+        return 'true'
+    if key is False:
+        return 'false'
+    if key is None:
+        return 'null'
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise _OrjsonMismatch
+
+
+def _to_json_natives(obj):
+    """
+    Convert a payload to the plain values json.dump(default=str) would encode.
+    
+    Raises _OrjsonMismatch for values orjson formats differently from the standard
+    encoder: non-ASCII text (json escapes it), non-finite floats (json writes NaN),
+    floats in exponent notation, integers outside 64 bits and keys that collide
+    once converted to strings.
+    """
+    if isinstance(obj, str):
+        if not obj.isascii():
+            raise _OrjsonMismatch
+        return str.__str__(obj)
+    if obj is None or obj is True or obj is False:
+        return obj
+    if isinstance(obj, int):
+        value = int.__int__(obj)
+        if not _ORJSON_MIN_INT <= value <= _ORJSON_MAX_INT:
+            raise _OrjsonMismatch
+        return value
+    if isinstance(obj, float):
+        value = float.__float__(obj)
+        if not math.isfinite(value) or 'e' in float.__repr__(value):
+            raise _OrjsonMismatch
+        return value
+    if isinstance(obj, (list, tuple)):
+        return [_to_json_natives(item) for item in obj]
+    if isinstance(obj, dict):
+        converted = {_to_json_key(key): _to_json_natives(value) for key, value in obj.items()}
+        if len(converted) != len(obj):
+            raise _OrjsonMismatch
+        return converted
+    # Everything else (datetimes, numpy scalars, arrays, ...) goes through default=str
+    return _to_json_natives(str(obj))
+
+
+def _encode_json_with_orjson(data) -> Optional[bytes]:
+    """Encode data with orjson exactly as json.dump(indent=2, default=str) would, or return None."""
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(_to_json_natives(data), option=_ORJSON_OPTIONS)
+    except (_OrjsonMismatch, RecursionError):
+        return None
+
+
+class ExportRecord(NamedTuple):
+    """A completed export, as tracked for the export summary."""
+    file_path: str
+    description: str
+    timestamp: float  # seconds since the epoch; converted to datetime in the summary
+    size_bytes: int
+
 
 class DataExporter:
     """
@@ -33,7 +146,8 @@ class DataExporter:
         self, 
         data: pd.DataFrame, 
         file_path: Union[str, Path], 
-        description: str = None
+        description: str = None,
+        compression: Optional[Union[str, Dict[str, Any]]] = None
     ) -> bool:
         """
         Export DataFrame to CSV with error handling.
@@ -42,6 +156,8 @@ class DataExporter:
             data: DataFrame to export
             file_path: Path where CSV should be saved
             description: Optional description for logging
+            compression: Optional pandas compression setting; inferred from
+                a .gz/.zst suffix when omitted
             
         Returns:
             bool: True if export successful, False otherwise
@@ -50,17 +166,27 @@ class DataExporter:
             file_path = Path(file_path)
             
             # Ensure directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            ensure_directories([file_path.parent])
+            
+            if compression is None:
+                compression = _CSV_COMPRESSION_BY_SUFFIX.get(file_path.suffix)
             
-            # Export DataFrame
-            data.to_csv(file_path, index=False)
+            # Export DataFrame; purely numeric frames bypass the pandas CSV writer
+            if compression is not None:
+                data.to_csv(file_path, index=False, chunksize=_CSV_CHUNK_ROWS, lineterminator='\n',
+                            compression=compression)
+            elif self._is_numeric_frame(data):
+                self._write_numeric_csv(data, file_path)
+            else:
+                with open(file_path, 'w', encoding='utf-8', newline='', buffering=_WRITE_BUFFER_BYTES) as f:
+                    data.to_csv(f, index=False, chunksize=_CSV_CHUNK_ROWS, lineterminator='\n')
             
             # Track export
-            self._track_export(file_path, description or "CSV Export")
+            size = file_path.stat().st_size
+            self._track_export(file_path, description or "CSV Export", size)
             
             # Log success
             if self.logger:
-                size = file_path.stat().st_size
                 self.logger.info(f"✅ CSV Export: {file_path} ({size} bytes)")
             
             return True
@@ -91,18 +217,24 @@ class DataExporter:
             file_path = Path(file_path)
             
             # Ensure directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Export JSON with proper serialization
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            ensure_directories([file_path.parent])
+            
+            # Export JSON with proper serialization; orjson is used only when its
+            # output is identical to the standard encoder's
+            json_bytes = _encode_json_with_orjson(data)
+            if json_bytes is not None:
+                with open(file_path, 'wb', buffering=_WRITE_BUFFER_BYTES) as f:
+                    f.write(json_bytes)
+            else:
+                with open(file_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_BYTES) as f:
+                    json.dump(data, f, indent=2, default=str)
             
             # Track export
-            self._track_export(file_path, description or "JSON Export")
+            size = file_path.stat().st_size
+            self._track_export(file_path, description or "JSON Export", size)
             
             # Log success
             if self.logger:
-                size = file_path.stat().st_size
                 self.logger.info(f"✅ JSON Export: {file_path} ({size} bytes)")
             
             return True
@@ -130,13 +262,14 @@ class DataExporter:
         try:
             export_dir = Path(export_dir)
             
-            summary = {}
-            for name, df in datasets.items():
-                summary[name] = {
-                    'records': len(df),
+            summary = {
+                name: {
+                    'records': df.shape[0],
                     'columns': df.columns.tolist(),
                     'date_range': self._get_date_range(df) if 'timestamp' in df.columns else 'N/A'
                 }
+                for name, df in datasets.items()
+            }
             
             summary_path = export_dir / "raw_data_summary.json"
             return self.export_to_json(summary, summary_path, "Raw Data Summary")
@@ -165,19 +298,18 @@ class DataExporter:
         """
         try:
             export_dir = Path(export_dir)
-            all_successful = True
             
-            for meter_type, meter_data in cleaned_vehicle_data.items():
-                if not meter_data.empty:
-                    csv_path = export_dir / f"{vehicle_id}_{meter_type}_cleaned.csv"
-                    success = self.export_to_csv(
-                        meter_data, 
-                        csv_path, 
-                        f"{vehicle_id} {meter_type} Cleaned Data"
-                    )
-                    all_successful = all_successful and success
+            exports = [
+                (
+                    meter_data,
+                    export_dir / f"{vehicle_id}_{meter_type}_cleaned.csv",
+                    f"{vehicle_id} {meter_type} Cleaned Data"
+                )
+                for meter_type, meter_data in cleaned_vehicle_data.items()
+                if not meter_data.empty
+            ]
             
-            return all_successful
+            return all(self.export_csvs_concurrently(exports))
             
         except Exception as e:
             if self.logger:
@@ -273,18 +405,13 @@ class DataExporter:
         """
         try:
             export_dir = Path(export_dir)
-            all_successful = True
+            exports = []
             
             # Export idle periods if available
             if idle_analysis.get('idle_periods'):
                 idle_df = pd.DataFrame(idle_analysis['idle_periods'])
                 idle_path = export_dir / f"{vehicle_id}_idle_periods.csv"
-                success = self.export_to_csv(
-                    idle_df, 
-                    idle_path, 
-                    f"{vehicle_id} Idle Periods"
-                )
-                all_successful = all_successful and success
+                exports.append((idle_df, idle_path, f"{vehicle_id} Idle Periods"))
             
             # Export utilization summary
             summary_data = {
@@ -296,38 +423,67 @@ class DataExporter:
             }
             summary_df = pd.DataFrame(summary_data)
             summary_path = export_dir / f"{vehicle_id}_utilization_summary.csv"
-            success = self.export_to_csv(
-                summary_df, 
-                summary_path, 
-                f"{vehicle_id} Utilization Summary"
-            )
-            all_successful = all_successful and success
+            exports.append((summary_df, summary_path, f"{vehicle_id} Utilization Summary"))
             
-            return all_successful
+            return all(self.export_csvs_concurrently(exports))
             
         except Exception as e:
             if self.logger:
                 self.logger.error(f"❌ Utilization data export failed for {vehicle_id}: {e}")
             return False
     
-    def _track_export(self, file_path: Path, description: str):
+    def export_csvs_concurrently(self, exports: List[tuple]) -> List[bool]:
+        """
+        Write several CSV exports on a thread pool.
+        
+        Args:
+            exports: List of (data, file_path, description) tuples
+            
+        Returns:
+            List[bool]: Success of each export, in the order given
+        """
+        if not exports:
+            return []
+        
+        # CSV writing is I/O-bound, so the writes overlap well across threads
+        with ThreadPoolExecutor(max_workers=min(_MAX_EXPORT_WORKERS, len(exports))) as executor:
+            futures = [executor.submit(self.export_to_csv, *export) for export in exports]
+            return [future.result() for future in futures]
+    
+    def _is_numeric_frame(self, data: pd.DataFrame) -> bool:
+        """Check whether every column is a plain numpy int/float column without missing values."""
+        return (
+            len(data.columns) > 0
+            and data.columns.is_unique
+            and all(isinstance(dtype, np.dtype) and dtype.kind in 'iuf' for dtype in data.dtypes)
+            and not data.isna().to_numpy().any()
+        )
+    
+    def _write_numeric_csv(self, data: pd.DataFrame, file_path: Path):
+        """Write an all-numeric DataFrame by formatting whole columns at once."""
+        with open(file_path, 'w', encoding='utf-8', newline='', buffering=_WRITE_BUFFER_BYTES) as f:
+            csv.writer(f, lineterminator='\n').writerow(data.columns)
+            for start in range(0, len(data), _CSV_CHUNK_ROWS):
+                chunk = data.iloc[start:start + _CSV_CHUNK_ROWS]
+                columns = [chunk.iloc[:, i].to_numpy().astype(str).tolist() for i in range(chunk.shape[1])]
+                f.write('\n'.join(map(','.join, zip(*columns))) + '\n')
+    
+    def _track_export(self, file_path: Path, description: str, size: Optional[int] = None):
         """Track completed exports for summary reporting."""
-        self.exports_completed.append({
-            'file_path': str(file_path),
-            'description': description,
-            'timestamp': datetime.now(),
-            'size_bytes': file_path.stat().st_size if file_path.exists() else 0
-        })
+        self.exports_completed.append(ExportRecord(
+            str(file_path),
+            description,
+            time.time(),
+            size if size is not None else file_path.stat().st_size
+        ))
     
     def _get_date_range(self, df: pd.DataFrame) -> Dict[str, str]:
         """Extract date range from DataFrame with timestamp column."""
         try:
-            timestamp_col = 'timestamp' if 'timestamp' in df.columns else 'TIMESTAMP'
-            if timestamp_col in df.columns:
-                return {
-                    'start': str(df[timestamp_col].min()),
-                    'end': str(df[timestamp_col].max())
-                }
+            timestamp_col = next((col for col in ('timestamp', 'TIMESTAMP') if col in df.columns), None)
+            if timestamp_col is not None:
+                start, end = df[timestamp_col].agg(['min', 'max'])
+                return {'start': str(start), 'end': str(end)}
         except Exception:
             pass
         return {'start': 'N/A', 'end': 'N/A'}
@@ -345,8 +501,11 @@ class DataExporter:
         try:
             summary = {
                 'total_exports': len(self.exports_completed),
-                'exports': self.exports_completed,
-                'summary_generated': str(datetime.now())
+                'exports': [
+                    {**record._asdict(), 'timestamp': datetime.fromtimestamp(record.timestamp)}
+                    for record in self.exports_completed
+                ],
+                'summary_generated': datetime.now()
             }
             
             return self.export_to_json(summary, output_path, "Export Summary")
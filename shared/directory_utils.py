@@ -0,0 +1,30 @@
+"""
+Directory Management
+
+Shared helper for creating report and export directories across AutoAnalytiX modules.
+Remembers created directories so repeated setup calls skip the filesystem.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable, Union
+
+# Directories already created by this process
+_ensured_directories = set()
+
+
+def ensure_directories(paths: Iterable[Union[str, Path]]) -> None:
+    """
+    Create each directory (with parents) the first time it is requested.
+
+    Requested paths are de-duplicated and created shallowest first with one
+    os.makedirs call each; paths created earlier in the run are skipped.
+
+    Args:
+        paths: Directories to create
+    """
+    pending = {os.fspath(path) for path in paths} - _ensured_directories
+
+    for directory in sorted(pending, key=len):
+        os.makedirs(directory, exist_ok=True)
+        _ensured_directories.add(directory)
@@ -0,0 +1,138 @@
+"""
+Mathematical Utilities
+
+Numeric helpers shared across AutoAnalytiX analysis modules.
+Operate on raw numpy arrays to avoid repeated pandas reductions.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, Union
+
+
+def calculate_basic_stats(values: Union[pd.Series, np.ndarray]) -> Dict[str, float]:
+    """
+    Calculate count, mean, standard deviation, min and max of a numeric series.
+
+    NaN values are dropped once up front (without copying when there are none) and
+    every statistic is derived from the same float64 array, matching pandas' skipna
+    semantics (std uses ddof=1).
+
+    Args:
+        values: Series or array of numeric values
+
+    Returns:
+        Dict[str, float]: 'count', 'mean', 'std', 'min' and 'max' (NaN when undefined)
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    nan_mask = np.isnan(arr)
+    if nan_mask.any():
+        arr = arr[~nan_mask]
+    count = arr.size
+
+    if count == 0:
+        return {'count': 0, 'mean': np.nan, 'std': np.nan, 'min': np.nan, 'max': np.nan}
+
+    mean = arr.sum() / count
+    std = np.nan
+    if count > 1:
+        # Squared deviations reuse a single scratch buffer
+        deviations = np.subtract(arr, mean)
+        np.square(deviations, out=deviations)
+        std = np.sqrt(deviations.sum() / (count - 1))
+
+    return {
+        'count': count,
+        'mean': mean,
+        'std': std,
+        'min': arr.min(),
+        'max': arr.max()
+    }
+
+
+def calculate_moving_averages(data_series: pd.Series, windows) -> Dict[str, pd.Series]:
+    """
+    Calculate centered moving averages for several window sizes.
+
+    Equivalent to ``data_series.rolling(window, center=True).mean()`` per window
+    (windows longer than the series shrink to the series length), but all windows
+    are derived from one shared cumulative sum. Series with NaN values fall back
+    to pandas, whose rolling windows skip them.
+
+    Args:
+        data_series: Series of readings in chronological order
+        windows: Iterable of window sizes
+
+    Returns:
+        Dict[str, pd.Series]: 'MA_<window>' -> moving average aligned to data_series
+    """
+    series_length = len(data_series)
+    values = data_series.to_numpy(dtype=np.float64)
+
+    if series_length == 0 or np.isnan(values).any():
+        return {
+            f'MA_{window}': data_series.rolling(window=min(window, series_length), center=True).mean()
+            for window in windows
+        }
+
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+    moving_averages = {}
+
+    for window in windows:
+        window_size = min(window, series_length)
+        ma = np.full(series_length, np.nan)
+
+        # Centered windows leave window_size // 2 leading NaNs, as in pandas
+        start = window_size // 2
+        ma[start:start + series_length - window_size + 1] = (cumulative[window_size:] - cumulative[:-window_size]) / window_size
+        moving_averages[f'MA_{window}'] = pd.Series(ma, index=data_series.index, name=data_series.name)
+
+    return moving_averages
+
+
+def calculate_percentiles(values: Union[pd.Series, np.ndarray], percentiles) -> Dict[float, float]:
+    """
+    Calculate several percentiles of the non-NaN values with a single sort.
+
+    Args:
+        values: Series or array of numeric values
+        percentiles: Iterable of percentiles in the 0-100 range
+
+    Returns:
+        Dict[float, float]: percentile -> value (linear interpolation, NaN when no data)
+    """
+    percentiles = list(percentiles)
+    arr = np.asarray(values, dtype=np.float64)
+    arr = arr[~np.isnan(arr)]
+
+    if arr.size == 0:
+        return dict.fromkeys(percentiles, np.nan)
+
+    quantiles = np.quantile(arr, np.asarray(percentiles, dtype=np.float64) / 100.0)
+    return dict(zip(percentiles, quantiles))
+
+
+def count_values_above(values: Union[pd.Series, np.ndarray], thresholds) -> Dict[float, int]:
+    """
+    Count how many non-NaN values exceed each threshold.
+
+    With three or more thresholds the values are sorted once and each count is a
+    binary search; fewer thresholds use direct comparisons to skip the sort.
+
+    Args:
+        values: Series or array of numeric values
+        thresholds: Iterable of threshold values
+
+    Returns:
+        Dict[float, int]: threshold -> number of values strictly greater than it
+    """
+    thresholds = list(thresholds)
+    arr = np.asarray(values, dtype=np.float64)
+    arr = arr[~np.isnan(arr)]
+
+    if len(thresholds) < 3:
+        return {threshold: int((arr > threshold).sum()) for threshold in thresholds}
+
+    sorted_values = np.sort(arr)
+    counts = sorted_values.size - np.searchsorted(sorted_values, thresholds, side='right')
+    return dict(zip(thresholds, counts.tolist()))
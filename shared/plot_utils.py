@@ -0,0 +1,277 @@
+"""
+Plot Utilities
+
+Shared helpers for saving analysis figures across AutoAnalytiX modules.
+Figures are rendered and written by a background process pool so plotting
+vehicles does not block on rasterization and disk I/O. matplotlib is imported
+on first use, so importing this module stays cheap.
+"""
+
+import gc
+import os
+import pickle
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+# Set AUTOANALYTIX_SINGLECORE=1 to save every plot in-process (useful for debugging)
+_SINGLECORE = os.environ.get('AUTOANALYTIX_SINGLECORE', '') == '1'
+_MAX_PLOT_WORKERS = min(4, os.cpu_count() or 1)
+
+# A single worker still saves one figure at a time, plus the pickling and transfer cost
+_SAVE_IN_PROCESS = _SINGLECORE or _MAX_PLOT_WORKERS < 2
+
+# Resolution for raster output; vector PDF content is unaffected by dpi
+DEFAULT_PLOT_DPI = 300
+
+# zlib level for PDF streams and PNG data (matplotlib's PDF default); drafts can pass compress_level=1
+DEFAULT_COMPRESS_LEVEL = 6
+
+# User-space buffer for plot file writes
+_WRITE_BUFFER_BYTES = 1 << 20
+
+# Closed figures between full garbage collections
+_GC_EVERY_N_FIGURES = 20
+_figures_closed = 0
+
+# (nrows, ncols, figsize) -> figure kept for reuse by create_figure
+_figure_cache = {}
+
+# pyplot module, set up on first use by _pyplot()
+_plt = None
+
+# Created on the first background save
+_plot_pool = None
+
+# (future, plot_path, on_saved) for saves not yet waited on, in submission order
+_pending_plots = deque()
+
+
+def _pyplot():
+    """Import pyplot on first use, selecting the non-interactive Agg backend once"""
+    global _plt
+    if _plt is None:
+        if 'matplotlib.pyplot' not in sys.modules:
+            import matplotlib
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as pyplot
+        _plt = pyplot
+    return _plt
+
+
+def _pdf_save_options(compress_level):
+    """PDF streams take their zlib level from rcParams"""
+    return {}, {'pdf.compression': compress_level}
+
+
+def _png_save_options(compress_level):
+    """PNG data is compressed by Pillow"""
+    return {'pil_kwargs': {'compress_level': compress_level}}, {}
+
+
+# Output format -> builder of (savefig kwargs, rcParams overrides) for a compression level
+_FORMAT_SAVE_OPTIONS = {
+    'pdf': _pdf_save_options,
+    'png': _png_save_options
+}
+
+
+def _write_figure(fig, plot_path, dpi, tight, compress_level, durable):
+    """Write a figure to disk through a large buffer, optionally cropped to its tight bounding box"""
+    plot_format = os.path.splitext(os.fspath(plot_path))[1][1:].lower() or None
+    save_options = _FORMAT_SAVE_OPTIONS.get(plot_format)
+    savefig_kwargs, rc_overrides = save_options(compress_level) if save_options else ({}, {})
+    savefig_kwargs.update(dpi=dpi, format=plot_format)
+    if tight:
+        savefig_kwargs['bbox_inches'] = 'tight'
+
+    if rc_overrides:
+        import matplotlib
+        with matplotlib.rc_context(rc_overrides):
+            _write_figure_file(fig, plot_path, savefig_kwargs, durable)
+    else:
+        _write_figure_file(fig, plot_path, savefig_kwargs, durable)
+
+
+def _write_figure_file(fig, plot_path, savefig_kwargs, durable):
+    """Stream savefig output into a buffered file, fsyncing it when durable"""
+    with open(plot_path, 'wb', buffering=_WRITE_BUFFER_BYTES) as f:
+        fig.savefig(f, **savefig_kwargs)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _render_and_write(pickled_fig, plot_path, dpi, tight, compress_level, durable):
+    """Worker entry point: rebuild a pickled figure and write it to disk"""
+    plt = _pyplot()
+
+    fig = pickle.loads(pickled_fig)
+    try:
+        _write_figure(fig, plot_path, dpi, tight, compress_level, durable)
+    finally:
+        plt.close(fig)
+
+
+def _get_plot_pool():
+    """Return the shared plot-saving pool, creating it on first use"""
+    global _plot_pool
+    if _plot_pool is None:
+        _plot_pool = ProcessPoolExecutor(max_workers=_MAX_PLOT_WORKERS)
+    return _plot_pool
+
+
+def _reset_plot_pool():
+    """Discard a broken plot-saving pool so the next background save starts a new one"""
+    global _plot_pool
+    if _plot_pool is not None:
+        _plot_pool.shutdown(wait=False)
+        _plot_pool = None
+
+
+def create_figure(nrows: int, ncols: int, figsize):
+    """
+    Return a figure and its subplot axes, reusing a figure of the same layout.
+
+    The first request for a layout creates the figure through pyplot; later
+    requests clear that figure and add fresh subplots, keeping its canvas
+    instead of allocating a new figure per plot. Lay the figure out with
+    fig.tight_layout() rather than plt.tight_layout(), as a reused figure is
+    not necessarily pyplot's current figure.
+
+    Args:
+        nrows: Number of subplot rows
+        ncols: Number of subplot columns
+        figsize: Figure size in inches as (width, height)
+
+    Returns:
+        Tuple of the figure and its axes, as returned by plt.subplots()
+    """
+    plt = _pyplot()
+
+    key = (nrows, ncols, tuple(figsize))
+    fig = _figure_cache.get(key)
+    if fig is None:
+        fig = plt.figure(figsize=figsize)
+        _figure_cache[key] = fig
+    else:
+        fig.clear()
+
+    return fig, fig.subplots(nrows, ncols)
+
+
+def save_plot(fig, plot_path: Union[str, Path], dpi: int = DEFAULT_PLOT_DPI, tight: bool = False,
+              compress_level: int = DEFAULT_COMPRESS_LEVEL, durable: bool = False,
+              on_saved: Optional[Callable[[], object]] = None) -> None:
+    """
+    Save a finished figure to disk in the background.
+
+    The figure is pickled and handed to a worker process, so the caller may
+    close it as soon as this returns. on_saved (typically plot verification)
+    runs from wait_for_plots() once the file is written. Figures that cannot be
+    pickled, figures submitted after a worker process has died, and every
+    figure on a single-CPU host or when AUTOANALYTIX_SINGLECORE=1 is set, are
+    saved synchronously and on_saved runs immediately. A broken pool is
+    replaced on the next save.
+
+    Plotters lay out their figures with tight_layout() before saving, so the
+    canvas is rendered once at its fixed size. Pass tight=True only for figures
+    with content outside the axes (e.g. outside legends) that must be cropped
+    to fit, as the tight bounding box costs an extra render pass.
+
+    Output is compressed at zlib level 6, matplotlib's PDF default. Lower
+    levels save slightly faster but leave vector PDFs noticeably larger.
+    Files are written through a 1 MiB buffer and left to the page cache unless
+    durable=True is passed.
+
+    Args:
+        fig: Matplotlib figure to save
+        plot_path: Destination file path
+        dpi: Output resolution for raster formats
+        tight: Crop to the tight bounding box of the figure contents
+        compress_level: zlib level (0-9) for PDF streams or PNG data
+        durable: fsync the file before the save counts as complete
+        on_saved: Callback to run once the file has been written
+    """
+    pickled_fig = None
+    if not _SAVE_IN_PROCESS:
+        try:
+            pickled_fig = pickle.dumps(fig)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            pickled_fig = None
+
+    if pickled_fig is not None:
+        try:
+            future = _get_plot_pool().submit(_render_and_write, pickled_fig, os.fspath(plot_path), dpi, tight,
+                                             compress_level, durable)
+        except BrokenProcessPool:
+            # A worker died; replace the pool and save this figure in-process
+            _reset_plot_pool()
+        else:
+            _pending_plots.append((future, plot_path, on_saved))
+            return
+
+    _write_figure(fig, plot_path, dpi, tight, compress_level, durable)
+    if on_saved is not None:
+        on_saved()
+
+
+def close_plot(fig) -> None:
+    """
+    Release a figure once a plotter is done with it and periodically collect garbage.
+
+    Figures from create_figure() are cleared and kept for reuse; any other
+    figure is closed. Only the given figure is touched, never every open
+    figure. Discarded artists hold reference cycles that CPython's
+    generational collector is slow to reclaim, so a full collection runs
+    after every few releases.
+
+    Args:
+        fig: Matplotlib figure to release
+    """
+    global _figures_closed
+    plt = _pyplot()
+
+    if any(fig is cached for cached in _figure_cache.values()):
+        fig.clear()
+    else:
+        plt.close(fig)
+
+    _figures_closed += 1
+    if _figures_closed % _GC_EVERY_N_FIGURES == 0:
+        gc.collect()
+
+
+def close_cached_figures() -> None:
+    """Close every figure kept for reuse by create_figure()"""
+    plt = _pyplot()
+
+    while _figure_cache:
+        _, fig = _figure_cache.popitem()
+        plt.close(fig)
+
+
+def wait_for_plots(logger) -> None:
+    """
+    Wait for background plot saves and run their callbacks in submission order.
+
+    Args:
+        logger: Logger used to report plots that failed to save
+    """
+    while _pending_plots:
+        future, plot_path, on_saved = _pending_plots.popleft()
+        try:
+            future.result()
+        except BrokenProcessPool as e:
+            logger.error(f"❌ Failed to save plot {plot_path}: {e}")
+            _reset_plot_pool()
+            continue
+        except Exception as e:
+            logger.error(f"❌ Failed to save plot {plot_path}: {e}")
+            continue
+
+        if on_saved is not None:
+            on_saved()